@@ -0,0 +1,50 @@
+# backend/alembic/env.py
+from __future__ import annotations
+
+"""
+Alembic migration environment.
+
+Migrations run against the synchronous engine configured from
+app.config.Settings.database_url, and autogenerate compares against the
+ORM metadata declared in app.models.
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+
+from app import models  # noqa: F401  (registers all tables on Base.metadata)
+from app.db.session import Base, engine
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """Emit migration SQL to stdout without connecting to the database."""
+    context.configure(
+        url=engine.url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Apply migrations over a live connection."""
+    with engine.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
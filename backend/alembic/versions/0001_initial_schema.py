@@ -0,0 +1,116 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+
+Baseline matching the tables previously created by Base.metadata.create_all.
+Databases that were bootstrapped that way already have these tables, so each
+one is only created if it is missing; `alembic upgrade head` then works on
+them as-is and records 0001 like on a fresh database.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "projects" not in existing:
+        op.create_table(
+            "projects",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("path", sa.String(), nullable=False),
+            sa.Column("meta", sa.JSON(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("name"),
+        )
+
+    if "scans" not in existing:
+        op.create_table(
+            "scans",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("project_id", sa.String(), nullable=False),
+            sa.Column("name", sa.String(), nullable=True),
+            sa.Column("target", sa.String(), nullable=False),
+            sa.Column("status", sa.Enum("PENDING", "RUNNING", "SUCCESS", "FAILED", name="scanstatus"), nullable=False),
+            sa.Column("tools", sa.JSON(), nullable=False),
+            sa.Column("chain", sa.String(), nullable=True),
+            sa.Column("meta", sa.JSON(), nullable=True),
+            sa.Column("logs", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("started_at", sa.DateTime(), nullable=True),
+            sa.Column("finished_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    if "findings" not in existing:
+        op.create_table(
+            "findings",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("scan_id", sa.String(), nullable=False),
+            sa.Column("tool", sa.String(), nullable=False),
+            sa.Column("title", sa.String(), nullable=False),
+            sa.Column("description", sa.Text(), nullable=False),
+            sa.Column("severity", sa.String(), nullable=False),
+            sa.Column("category", sa.String(), nullable=True),
+            sa.Column("file_path", sa.String(), nullable=True),
+            sa.Column("line_number", sa.String(), nullable=True),
+            sa.Column("function", sa.String(), nullable=True),
+            sa.Column("tool_version", sa.String(), nullable=True),
+            sa.Column("input_seed", sa.String(), nullable=True),
+            sa.Column("coverage", sa.JSON(), nullable=True),
+            sa.Column("assertions", sa.JSON(), nullable=True),
+            sa.Column("raw", sa.JSON(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(["scan_id"], ["scans.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    if "tool_executions" not in existing:
+        op.create_table(
+            "tool_executions",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("scan_id", sa.String(), nullable=False),
+            sa.Column("tool", sa.String(), nullable=False),
+            sa.Column("status", sa.Enum("PENDING", "RUNNING", "SUCCEEDED", "FAILED", "RETRYING", name="toolexecutionstatus"), nullable=False),
+            sa.Column("attempt", sa.Integer(), nullable=False),
+            sa.Column("started_at", sa.DateTime(), nullable=True),
+            sa.Column("finished_at", sa.DateTime(), nullable=True),
+            sa.Column("duration_seconds", sa.Float(), nullable=True),
+            sa.Column("command", sa.JSON(), nullable=True),
+            sa.Column("exit_code", sa.Integer(), nullable=True),
+            sa.Column("stdout_path", sa.String(), nullable=True),
+            sa.Column("stderr_path", sa.String(), nullable=True),
+            sa.Column("environment", sa.JSON(), nullable=True),
+            sa.Column("artifacts_path", sa.String(), nullable=True),
+            sa.Column("error", sa.Text(), nullable=True),
+            sa.Column("parsing_error", sa.Text(), nullable=True),
+            sa.Column("failure_reason", sa.String(), nullable=True),
+            sa.Column("findings_count", sa.Integer(), nullable=False),
+            sa.Column("tool_version", sa.String(), nullable=True),
+            sa.Column("input_seed", sa.String(), nullable=True),
+            sa.Column("coverage", sa.JSON(), nullable=True),
+            sa.Column("assertions", sa.JSON(), nullable=True),
+            sa.ForeignKeyConstraint(["scan_id"], ["scans.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("tool_executions")
+    op.drop_table("findings")
+    op.drop_table("scans")
+    op.drop_table("projects")
+    sa.Enum(name="toolexecutionstatus").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="scanstatus").drop(op.get_bind(), checkfirst=True)
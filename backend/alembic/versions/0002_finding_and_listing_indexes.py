@@ -0,0 +1,48 @@
+"""finding and listing indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+
+Databases created by Base.metadata.create_all from the current models (the
+development startup does that) already have these indexes; only missing
+ones are created.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ("ix_findings_scan_created", "findings", ["scan_id", "created_at"]),
+    (op.f("ix_findings_severity"), "findings", ["severity"]),
+    (op.f("ix_findings_tool"), "findings", ["tool"]),
+    (op.f("ix_projects_created_at"), "projects", ["created_at"]),
+    (op.f("ix_scans_created_at"), "scans", ["created_at"]),
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    existing = {
+        (table, index["name"])
+        for table in {table for _, table, _ in INDEXES}
+        for index in inspector.get_indexes(table)
+    }
+    for name, table, columns in INDEXES:
+        if (table, name) not in existing:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_scans_created_at"), table_name="scans")
+    op.drop_index(op.f("ix_projects_created_at"), table_name="projects")
+    op.drop_index(op.f("ix_findings_tool"), table_name="findings")
+    op.drop_index(op.f("ix_findings_severity"), table_name="findings")
+    op.drop_index("ix_findings_scan_created", table_name="findings")
@@ -0,0 +1,54 @@
+"""store JSON columns as jsonb
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+JSON_COLUMNS = (
+    ("projects", "meta", True),
+    ("scans", "tools", False),
+    ("scans", "meta", True),
+    ("findings", "coverage", True),
+    ("findings", "assertions", True),
+    ("findings", "raw", True),
+    ("tool_executions", "command", True),
+    ("tool_executions", "environment", True),
+    ("tool_executions", "coverage", True),
+    ("tool_executions", "assertions", True),
+)
+
+
+def upgrade() -> None:
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.JSONB(),
+            type_=sa.JSON(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::json",
+        )
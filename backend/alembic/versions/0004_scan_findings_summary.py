@@ -0,0 +1,35 @@
+"""scan findings summary columns
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15
+
+Columns that already exist (databases created by Base.metadata.create_all
+from the current models) are left alone.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    existing = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("scans")}
+    if "findings_total" not in existing:
+        op.add_column("scans", sa.Column("findings_total", sa.Integer(), nullable=True))
+    if "findings_by_severity" not in existing:
+        op.add_column("scans", sa.Column("findings_by_severity", postgresql.JSONB(), nullable=True))
+    if "findings_by_tool" not in existing:
+        op.add_column("scans", sa.Column("findings_by_tool", postgresql.JSONB(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("scans", "findings_by_tool")
+    op.drop_column("scans", "findings_by_severity")
+    op.drop_column("scans", "findings_total")
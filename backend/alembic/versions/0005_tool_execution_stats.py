@@ -0,0 +1,29 @@
+"""tool execution stats column
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15
+
+Columns that already exist (databases created by Base.metadata.create_all
+from the current models) are left alone.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    existing = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("tool_executions")}
+    if "stats" not in existing:
+        op.add_column("tool_executions", sa.Column("stats", postgresql.JSONB(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("tool_executions", "stats")
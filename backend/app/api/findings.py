@@ -1,27 +1,86 @@
 # backend/app/api/findings.py
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+import asyncio
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import models, schemas
-from app.db.session import get_db
+from app.api.pagination import PageParams, page_params, paginate
+from app.config import get_settings
+from app.db.session import STRICT_LOADING, StreamSessionLocal, get_db
 
 router = APIRouter(prefix="/findings", tags=["findings"])
 
+settings = get_settings()
 
-@router.get("", response_model=list[schemas.FindingRead])
-def list_findings(
-    db: Session = Depends(get_db),
-    tool: str | None = Query(default=None),
-    severity: str | None = Query(default=None),
-    scan_id: str | None = Query(default=None),
-) -> list[schemas.FindingRead]:
-    query = db.query(models.Finding)
+# Rows fetched per server-side cursor round-trip when streaming.
+_STREAM_BATCH_SIZE = 500
+
+# Bounds the connections held by streams in this worker (see
+# StreamSessionLocal).
+_STREAM_SLOTS = asyncio.Semaphore(settings.findings_stream_max)
+
+
+def _findings_stmt(
+    tool: str | None,
+    severity: str | None,
+    scan_id: str | None,
+) -> Select:
+    stmt = select(models.Finding).options(*STRICT_LOADING)
     if tool:
-        query = query.filter(models.Finding.tool == tool)
+        stmt = stmt.where(models.Finding.tool == tool)
     if severity:
-        query = query.filter(models.Finding.severity == severity)
+        stmt = stmt.where(models.Finding.severity == severity)
     if scan_id:
-        query = query.filter(models.Finding.scan_id == scan_id)
-    return query.order_by(models.Finding.created_at.desc()).all()
+        stmt = stmt.where(models.Finding.scan_id == scan_id)
+    return stmt.order_by(models.Finding.created_at.desc())
+
+
+async def _iter_ndjson(stmt: Select) -> AsyncIterator[bytes]:
+    # The request-scoped get_db session is closed before a streaming body
+    # is sent, so the stream owns its session, on an unpooled connection so
+    # a slow download does not hold one of the worker's pooled connections.
+    async with _STREAM_SLOTS, StreamSessionLocal() as db:
+        result = await db.stream_scalars(
+            stmt.execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        async for batch in result.partitions():
+            yield b"".join(
+                schemas.FindingRead.model_validate(row).model_dump_json().encode() + b"\n"
+                for row in batch
+            )
+
+
+@router.get("", response_model=schemas.Page[schemas.FindingRead])
+async def list_findings(
+    db: AsyncSession = Depends(get_db),
+    tool: str | None = Query(default=None),
+    severity: str | None = Query(default=None),
+    scan_id: str | None = Query(default=None),
+    page: PageParams = Depends(page_params),
+) -> Response:
+    stmt = _findings_stmt(tool, severity, scan_id)
+    return await paginate(db, stmt, page, schemas.FindingPage)
+
+
+@router.get("/stream")
+async def stream_findings(
+    tool: str | None = Query(default=None),
+    severity: str | None = Query(default=None),
+    scan_id: str | None = Query(default=None),
+) -> StreamingResponse:
+    """
+    Stream every matching finding as NDJSON (one FindingRead per line).
+
+    Rows are read through a server-side cursor in batches, so memory stays
+    bounded by the batch size rather than by the number of findings.
+    """
+    return StreamingResponse(
+        _iter_ndjson(_findings_stmt(tool, severity, scan_id)),
+        media_type="application/x-ndjson",
+    )
@@ -0,0 +1,64 @@
+# backend/app/api/pagination.py
+from __future__ import annotations
+
+"""
+LIMIT/OFFSET pagination shared by the list endpoints.
+
+Routes depend on `page_params` for the query parameters and hand their
+ordered SELECT to `paginate`, which returns the `schemas.Page` envelope
+already encoded as JSON.
+"""
+
+from dataclasses import dataclass
+
+from fastapi import Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@dataclass
+class PageParams:
+    limit: int
+    offset: int
+    count: bool
+
+
+def page_params(
+    limit: int = Query(default=50, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
+    count: bool = Query(
+        default=False,
+        description="Also return the total number of matching rows (extra query).",
+    ),
+) -> PageParams:
+    return PageParams(limit=limit, offset=offset, count=count)
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select,
+    page: PageParams,
+    adapter: TypeAdapter,
+) -> Response:
+    """Run `stmt` with LIMIT/OFFSET applied and return the encoded page envelope.
+
+    `adapter` is one of the module-level `schemas.*Page` adapters; the rows are
+    validated and dumped in a single call rather than per item.
+    """
+    result = await db.execute(stmt.limit(page.limit).offset(page.offset))
+    total = None
+    if page.count:
+        total = await db.scalar(
+            select(func.count()).select_from(stmt.order_by(None).subquery())
+        )
+    envelope = adapter.validate_python(
+        {
+            "items": result.scalars().all(),
+            "total": total,
+            "limit": page.limit,
+            "offset": page.offset,
+        },
+        from_attributes=True,
+    )
+    return Response(content=adapter.dump_json(envelope), media_type="application/json")
@@ -1,27 +1,27 @@
 # backend/app/api/projects.py
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import models, schemas
-from app.db.session import get_db
+from app.api.pagination import PageParams, page_params, paginate
+from app.db.session import STRICT_LOADING, get_db
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
 @router.post("", response_model=schemas.ProjectRead)
-def create_project(
+async def create_project(
     payload: schemas.ProjectCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> schemas.ProjectRead:
     # Enforce unique name at application level to produce nicer errors
-    existing = (
-        db.query(models.Project)
-        .filter(models.Project.name == payload.name)
-        .first()
+    name_taken = await db.scalar(
+        select(exists().where(models.Project.name == payload.name))
     )
-    if existing:
+    if name_taken:
         raise HTTPException(
             status_code=400,
             detail=f"Project with name '{payload.name}' already exists.",
@@ -33,25 +33,32 @@ def create_project(
         meta=payload.meta,
     )
     db.add(project)
-    db.commit()
-    db.refresh(project)
+    await db.commit()
     return project
 
 
-@router.get("", response_model=list[schemas.ProjectRead])
-def list_projects(db: Session = Depends(get_db)) -> list[schemas.ProjectRead]:
-    return db.query(models.Project).order_by(models.Project.created_at.desc()).all()
+@router.get("", response_model=schemas.Page[schemas.ProjectRead])
+async def list_projects(
+    db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(page_params),
+) -> Response:
+    stmt = (
+        select(models.Project)
+        .options(*STRICT_LOADING)
+        .order_by(models.Project.created_at.desc())
+    )
+    return await paginate(db, stmt, page, schemas.ProjectPage)
 
 
 @router.get("/{project_id}", response_model=schemas.ProjectRead)
-def get_project(
+async def get_project(
     project_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> schemas.ProjectRead:
-    project = (
-        db.query(models.Project)
-        .filter(models.Project.id == project_id)
-        .first()
+    project = await db.scalar(
+        select(models.Project)
+        .options(*STRICT_LOADING)
+        .where(models.Project.id == project_id)
     )
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -59,17 +66,15 @@ def get_project(
 
 
 @router.delete("/{project_id}")
-def delete_project(
+async def delete_project(
     project_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
-    project = (
-        db.query(models.Project)
-        .filter(models.Project.id == project_id)
-        .first()
+    project = await db.scalar(
+        select(models.Project).where(models.Project.id == project_id)
     )
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    db.delete(project)
-    db.commit()
+    await db.delete(project)
+    await db.commit()
     return {"status": "deleted"}
@@ -1,40 +1,90 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, selectinload
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 
 from app import models, schemas
-from app.db.session import get_db
+from app.api.pagination import PageParams, page_params, paginate
+from app.db.session import STRICT_LOADING, SessionLocal, get_db
 from app.services.scanner import execute_scan
 
-router = APIRouter(prefix="/scans", tags=["scans"])
+try:
+    from app.services.tasks import run_scan_task
+except ImportError:  # Celery not installed; scans run inline.
+    run_scan_task = None
 
+router = APIRouter(prefix="/scans", tags=["scans"])
 
-def _dispatch_scan(db: Session, scan: models.Scan) -> None:
-    """Kick off scan execution via Celery, with a synchronous fallback."""
 
-    meta = scan.meta.copy() if scan.meta else {}
+def _dispatch_scan(scan_id: str) -> None:
+    """Kick off scan execution via Celery, with a synchronous fallback.
 
+    Scheduled as a background task so broker latency is paid after the
+    response has been sent. The worker records ``celery_task_id`` in
+    scan.meta when it picks the task up (see app.services.tasks).
+    """
     try:
-        from app.services.tasks import run_scan_task
-
-        async_result = run_scan_task.delay(scan.id)
-        meta["celery_task_id"] = async_result.id
-        meta["execution_mode"] = "celery"
-        scan.meta = meta
-        db.commit()
-        db.refresh(scan)
-        return
+        if run_scan_task is None:
+            raise RuntimeError("Celery task module is not available")
+        run_scan_task.delay(scan_id)
     except Exception as exc:  # noqa: BLE001
-        meta["execution_mode"] = "inline"
-        meta["dispatch_error"] = str(exc)
-        scan.meta = meta
-        db.commit()
-        db.refresh(scan)
+        with SessionLocal() as db:
+            scan = db.get(models.Scan, scan_id)
+            if scan is not None:
+                if scan.meta is None:
+                    scan.meta = {}
+                scan.meta["execution_mode"] = "inline"
+                scan.meta["dispatch_error"] = str(exc)
+                db.commit()
+        execute_scan(scan_id)
+
+
+async def _upsert_project(
+    db: AsyncSession,
+    *,
+    name: str,
+    path: str,
+    meta: dict | None,
+    merge_meta: bool,
+) -> models.Project:
+    """Create a project by name, or update the existing one, in one statement.
+
+    Uses INSERT ... ON CONFLICT (name) DO UPDATE ... RETURNING so the lookup,
+    insert and update happen in a single round-trip, and concurrent scans for
+    a new project name cannot race each other into a unique violation.
+
+    On conflict the path is always refreshed. The meta is only touched when
+    ``meta`` is given: merged key-by-key into the stored meta when
+    ``merge_meta`` is set, replaced otherwise.
+    """
+    stmt = pg_insert(models.Project).values(name=name, path=path, meta=meta)
+
+    set_ = {"path": stmt.excluded.path}
+    if meta is not None:
+        if merge_meta:
+            # Stored meta may be SQL NULL or JSON null; treat both as {}.
+            existing = func.coalesce(
+                func.nullif(models.Project.meta, literal_column("'null'::jsonb")),
+                literal_column("'{}'::jsonb"),
+            )
+            set_["meta"] = existing.op("||")(stmt.excluded.meta)
+        else:
+            set_["meta"] = stmt.excluded.meta
 
-    execute_scan(scan.id)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[models.Project.name],
+        set_=set_,
+    ).returning(models.Project)
 
+    project = await db.scalar(stmt, execution_options={"populate_existing": True})
+    await db.commit()
+    return project
 
-def _create_scan(
-    db: Session,
+
+async def _create_scan(
+    db: AsyncSession,
+    background: BackgroundTasks,
     project_id: str,
     target: str,
     tools: list[str],
@@ -52,17 +102,17 @@ def _create_scan(
         status=models.ScanStatus.PENDING,
     )
     db.add(scan)
-    db.commit()
-    db.refresh(scan)
+    await db.commit()
 
-    _dispatch_scan(db, scan)
+    background.add_task(_dispatch_scan, scan.id)
     return scan
 
 
 @router.post("", response_model=schemas.ScanRead)
-def start_scan(
+async def start_scan(
+    background: BackgroundTasks,
     payload: schemas.ScanRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> schemas.ScanRead:
     """
     General scan endpoint.
@@ -70,56 +120,35 @@ def start_scan(
     - If payload.project_id is provided, attach scan to that project.
     - Otherwise, find or create project by name + path & meta.
     """
-    project: models.Project | None = None
+    project_id: str | None = None
 
     if payload.project_id:
-        project = (
-            db.query(models.Project)
-            .filter(models.Project.id == payload.project_id)
-            .first()
+        # Only the id is needed here; don't hydrate the whole Project row.
+        project_id = await db.scalar(
+            select(models.Project.id).where(models.Project.id == payload.project_id)
         )
-        if not project:
+        if not project_id:
             raise HTTPException(status_code=404, detail="Project not found")
     else:
-        project = (
-            db.query(models.Project)
-            .filter(models.Project.name == payload.project_name)
-            .first()
-        )
-
         meta = payload.meta.copy() if payload.meta else {}
         if payload.chain:
             meta.setdefault("chain", payload.chain)
         if payload.scan_name:
             meta.setdefault("scan_name", payload.scan_name)
 
-        if not project:
-            project = models.Project(
-                name=payload.project_name,
-                path=payload.project_path,
-                meta=meta or None,
-            )
-            db.add(project)
-            db.commit()
-            db.refresh(project)
-        else:
-            updated = False
-            if payload.project_path and project.path != payload.project_path:
-                project.path = payload.project_path
-                updated = True
-            if meta:
-                existing_meta = project.meta or {}
-                merged_meta = {**existing_meta, **meta}
-                if merged_meta != existing_meta:
-                    project.meta = merged_meta
-                    updated = True
-            if updated:
-                db.commit()
-                db.refresh(project)
+        project = await _upsert_project(
+            db,
+            name=payload.project_name,
+            path=payload.project_path,
+            meta=meta or None,
+            merge_meta=True,
+        )
+        project_id = project.id
 
-    scan = _create_scan(
+    scan = await _create_scan(
         db=db,
-        project_id=project.id,
+        background=background,
+        project_id=project_id,
         target=payload.target,
         tools=payload.tools,
         name=payload.scan_name,
@@ -130,43 +159,26 @@ def start_scan(
 
 
 @router.post("/quick", response_model=schemas.QuickScanResponse)
-def quick_scan(
+async def quick_scan(
+    background: BackgroundTasks,
     payload: schemas.QuickScanRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> schemas.QuickScanResponse:
     """
     Convenience endpoint: ensures a project exists by name, then starts a scan.
     """
-    project = (
-        db.query(models.Project)
-        .filter(models.Project.name == payload.project.name)
-        .first()
+    # Keep project path/meta in sync with latest request
+    project = await _upsert_project(
+        db,
+        name=payload.project.name,
+        path=payload.project.path,
+        meta=payload.project.meta,
+        merge_meta=False,
     )
 
-    if not project:
-        project = models.Project(
-            name=payload.project.name,
-            path=payload.project.path,
-            meta=payload.project.meta,
-        )
-        db.add(project)
-        db.commit()
-        db.refresh(project)
-    else:
-        # Keep project path/meta in sync with latest request
-        updated = False
-        if project.path != payload.project.path:
-            project.path = payload.project.path
-            updated = True
-        if payload.project.meta is not None and payload.project.meta != project.meta:
-            project.meta = payload.project.meta
-            updated = True
-        if updated:
-            db.commit()
-            db.refresh(project)
-
-    scan = _create_scan(
+    scan = await _create_scan(
         db=db,
+        background=background,
         project_id=project.id,
         target=payload.target,
         tools=payload.tools,
@@ -176,29 +188,36 @@ def quick_scan(
     return schemas.QuickScanResponse(project_id=project.id, scan_id=scan.id)
 
 
-@router.get("", response_model=list[schemas.ScanRead])
-def list_scans(db: Session = Depends(get_db)) -> list[schemas.ScanRead]:
-    return (
-        db.query(models.Scan)
+@router.get("", response_model=schemas.Page[schemas.ScanRead])
+async def list_scans(
+    db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(page_params),
+) -> Response:
+    stmt = (
+        select(models.Scan)
+        .options(*STRICT_LOADING)
         .order_by(models.Scan.created_at.desc())
-        .all()
     )
+    return await paginate(db, stmt, page, schemas.ScanPage)
 
 
 @router.get("/{scan_id}", response_model=schemas.ScanDetail)
-def get_scan(
+async def get_scan(
     scan_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> schemas.ScanDetail:
-    scan = (
-        db.query(models.Scan)
+    # tool_executions is bounded by the number of tools, so JOIN it into the
+    # scan query; findings can be large and keep their own IN-list query.
+    result = await db.execute(
+        select(models.Scan)
         .options(
+            joinedload(models.Scan.tool_executions),
             selectinload(models.Scan.findings),
-            selectinload(models.Scan.tool_executions),
+            *STRICT_LOADING,
         )
-        .filter(models.Scan.id == scan_id)
-        .first()
+        .where(models.Scan.id == scan_id)
     )
+    scan = result.unique().scalar_one_or_none()
     if not scan:
         raise HTTPException(status_code=404, detail="Scan not found")
     return scan
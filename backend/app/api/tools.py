@@ -1,8 +1,8 @@
 # backend/app/api/tools.py
 from __future__ import annotations
 
-from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi import APIRouter, Response
+from pydantic import BaseModel, TypeAdapter
 
 from app.config import get_settings
 
@@ -15,16 +15,9 @@ class ToolInfo(BaseModel):
     docker_image: str
 
 
-@router.get("", response_model=list[ToolInfo])
-def list_tools() -> list[ToolInfo]:
-    """
-    Return the supported tools and their Docker images.
-
-    All tools are expected to run inside containers; no host-installed
-    security tools are used, in line with the project constraints.
-    """
+def _build_tools() -> tuple[ToolInfo, ...]:
     settings = get_settings()
-    return [
+    return (
         ToolInfo(
             name="slither",
             kind="static-analysis",
@@ -40,4 +33,21 @@ def list_tools() -> list[ToolInfo]:
             kind="tests-fuzzing-invariants",
             docker_image=settings.foundry_image,
         ),
-    ]
+    )
+
+
+# Settings are fixed for the lifetime of the process, so the tool list and
+# its JSON body are built once at import instead of on every request.
+_TOOLS = _build_tools()
+_TOOLS_JSON = TypeAdapter(list[ToolInfo]).dump_json(list(_TOOLS))
+
+
+@router.get("", response_model=list[ToolInfo])
+async def list_tools() -> Response:
+    """
+    Return the supported tools and their Docker images.
+
+    All tools are expected to run inside containers; no host-installed
+    security tools are used, in line with the project constraints.
+    """
+    return Response(content=_TOOLS_JSON, media_type="application/json")
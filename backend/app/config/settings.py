@@ -26,6 +26,24 @@ class Settings(BaseSettings):
   # Database
   database_url: str = "postgresql+psycopg2://postgres:postgres@db:5432/scan"
 
+  # Connection pool sizing. db_max_connections is what the whole deployment
+  # may hold open; keep it below Postgres' limit (`SHOW max_connections;`,
+  # 100 by default) with room left for migrations and psql. It is split
+  # evenly over the processes that pool connections: the uvicorn workers
+  # (WEB_CONCURRENCY, one per CPU by default as in the Dockerfile) and the
+  # Celery pool processes (one per CPU by default). The sqlalchemy_* values
+  # override the derived per-process pool_size / max_overflow.
+  db_max_connections: int = 80
+  web_concurrency: int | None = None
+  celery_worker_concurrency: int | None = None
+  sqlalchemy_pool_size: int | None = None
+  sqlalchemy_max_overflow: int | None = None
+  # Concurrent NDJSON findings exports per API worker. Each holds its own
+  # unpooled connection for the length of the download, on top of
+  # db_max_connections, so the regular pool is not starved; further
+  # exports wait for a free slot.
+  findings_stream_max: int = 4
+
   # Celery / Redis
   celery_broker_url: str = "redis://redis:6379/1"
   celery_result_backend: str = "redis://redis:6379/2"
@@ -49,6 +67,18 @@ class Settings(BaseSettings):
 
   projects_host_root: str | None = None
 
+  # Opt-in warm container pool (app.services.tools.docker_pool): tools run
+  # via `docker exec` in one long-lived container per image and worker
+  # instead of a `docker run --rm` per scan. docker_pool_host_root is the
+  # HOST directory mounted into those containers (defaults to
+  # projects_host_root).
+  docker_pool_enabled: bool = False
+  docker_pool_host_root: str | None = None
+
+  # Pull (if missing) and start each tool image once when a Celery worker
+  # boots, so the first scan doesn't pay for the pull and layer unpacking.
+  docker_warmup_enabled: bool = True
+
   # Per-tool runtime defaults (seconds)
   slither_timeout_seconds: int = 600
   slither_max_runtime_seconds: int | None = 900
@@ -8,25 +8,64 @@ This module depends on:
 - app.config.settings.get_settings for the DATABASE_URL
 It is imported by:
 - app.models (for Base)
-- app.main (for engine/Base)
-- any code needing a DB session (via SessionLocal or get_db)
+- app.main (for async_engine/Base)
+- API routes needing an async DB session (via get_db)
+- the scanner / Celery worker needing a sync DB session (via SessionLocal)
 """
 
+import os
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base, raiseload, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.config import get_settings
 
 # Load settings once; get_settings() is cached in app.config.settings
 settings = get_settings()
 
-# SQLAlchemy engine for PostgreSQL (or any DB configured in DATABASE_URL)
+
+def _pool_sizes() -> tuple[int, int]:
+    """(pool_size, max_overflow) for this process's share of db_max_connections."""
+    cpus = os.cpu_count() or 1
+    processes = (settings.web_concurrency or cpus) + (settings.celery_worker_concurrency or cpus)
+    share = max(1, settings.db_max_connections // processes)
+    pool_size = settings.sqlalchemy_pool_size
+    if pool_size is None:
+        pool_size = max(1, share // 2)
+    max_overflow = settings.sqlalchemy_max_overflow
+    if max_overflow is None:
+        max_overflow = max(0, share - pool_size)
+    return pool_size, max_overflow
+
+
+_POOL_SIZE, _MAX_OVERFLOW = _pool_sizes()
+
+# Engine configuration shared by the sync and async engines. Each process
+# only pools connections on one of them: the Celery workers use the sync
+# engine, the API the async one (see unpool_sync_engine). pool_pre_ping
+# discards connections dropped by Postgres before handing them out, and
+# pool_recycle retires them before server/proxy idle timeouts kick in.
+# query_cache_size enlarges the compiled-statement LRU (default 500) so the
+# select() variants built by the routes stay compiled.
+_ENGINE_OPTIONS = dict(
+    pool_size=_POOL_SIZE,
+    max_overflow=_MAX_OVERFLOW,
+    pool_timeout=10,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+    query_cache_size=1200,
+)
+
+# Synchronous SQLAlchemy engine, used by the scanner runner and Celery tasks
 engine = create_engine(
     settings.database_url,
     future=True,
+    **_ENGINE_OPTIONS,
 )
 
-# Session factory used throughout the app
+# Session factory used by synchronous code (scanner, Celery tasks, scripts)
 SessionLocal = sessionmaker(
     bind=engine,
     autoflush=False,
@@ -34,20 +73,68 @@ SessionLocal = sessionmaker(
     future=True,
 )
 
+# Async engine over asyncpg, used by the FastAPI routes so DB waits yield
+# to the event loop instead of occupying a threadpool slot.
+async_engine = create_async_engine(
+    settings.database_url.replace("psycopg2", "asyncpg"),
+    **_ENGINE_OPTIONS,
+)
+
+# Async session factory; objects stay loaded after commit so routes can
+# return them for serialization without another round-trip.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# Unpooled async engine for long-lived streaming responses (findings
+# export): a stream holds its connection until the client has read
+# everything, which would starve the small per-worker pool above. These
+# connections come on top of db_max_connections; app.api.findings caps how
+# many a worker opens at once (settings.findings_stream_max).
+stream_engine = create_async_engine(
+    settings.database_url.replace("psycopg2", "asyncpg"),
+    poolclass=NullPool,
+)
+
+StreamSessionLocal = async_sessionmaker(
+    bind=stream_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+def unpool_sync_engine() -> None:
+    """
+    Rebind SessionLocal to an engine without a connection pool.
+
+    Called by the API (app.main), which only needs sync sessions for the
+    inline scan fallback: its uvicorn workers then keep no idle sync
+    connections, and the async pool gets their whole share.
+    """
+    global engine
+    engine.dispose()
+    engine = create_engine(settings.database_url, future=True, poolclass=NullPool)
+    SessionLocal.configure(bind=engine)
+
+
 # Base class for all ORM models
 Base = declarative_base()
 
+# Loader options for list/detail queries: in development any relationship
+# that was not explicitly eager-loaded raises on access instead of quietly
+# issuing one SELECT per row (N+1). Empty outside development.
+STRICT_LOADING = (raiseload("*"),) if settings.environment == "development" else ()
+
 
-def get_db():
+async def get_db():
     """
-    FastAPI dependency that yields a DB session and ensures it is closed.
+    FastAPI dependency that yields an async DB session and ensures it is closed.
 
     Example usage in a route:
         from app.db.session import get_db
-        def endpoint(db: Session = Depends(get_db)): ...
+        async def endpoint(db: AsyncSession = Depends(get_db)): ...
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -6,22 +6,31 @@ FastAPI application setup.
 
 This module depends on:
 - app.config.get_settings for configuration
-- app.db.session.Base and engine for DB initialization
+- app.db.session.Base and async_engine for DB initialization (and
+  unpool_sync_engine for the inline scan fallback)
 - app.api.api_router for route registration
 """
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api import api_router
 from app.config import get_settings
-from app.db.session import Base, engine
+from app.db.session import Base, async_engine, unpool_sync_engine
 
 settings = get_settings()
 
+# Routes use the async engine; sync sessions are only opened by the inline
+# scan fallback, so don't pool them in every API worker.
+unpool_sync_engine()
+
 app = FastAPI(
     title=settings.app_name,
     version="0.1.0",
+    # orjson encodes the large ScanDetail payloads (nested raw/coverage
+    # JSON) several times faster than the stdlib json module.
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -45,14 +54,18 @@ app.include_router(api_router, prefix="/api")
 
 
 @app.on_event("startup")
-def on_startup() -> None:
+async def on_startup() -> None:
     """
-    Initialize database schema on startup.
+    Create missing tables in development only.
 
-    In a production-grade deployment you'll normally use Alembic migrations
-    instead of `create_all`, but this keeps the system runnable out of the box.
+    Other environments manage the schema with Alembic (`alembic upgrade head`,
+    run once by the compose `migrate` job), so API workers don't race each
+    other issuing DDL at boot.
     """
-    Base.metadata.create_all(bind=engine)
+    if settings.environment != "development":
+        return
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
 
 # ---- Healthcheck ----
@@ -29,11 +29,13 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
-    JSON,
     String,
     Text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import relationship
 
 from app.db.session import Base
@@ -60,8 +62,8 @@ class Project(Base):
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String, unique=True, nullable=False)
     path = Column(String, nullable=False)  # path to project root (host or workspace)
-    meta = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    meta = Column(JSONB, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
     scans = relationship(
         "Scan",
@@ -86,16 +88,23 @@ class Scan(Base):
     status = Column(Enum(ScanStatus), default=ScanStatus.PENDING, nullable=False)
 
     # List of tools: ["slither", "echidna", "foundry"]
-    tools = Column(JSON, nullable=False, default=list)
+    tools = Column(JSONB, nullable=False, default=list)
 
-    # Optional chain/network tag and arbitrary metadata
+    # Optional chain/network tag and arbitrary metadata. MutableDict tracks
+    # in-place key writes (e.g. dispatch bookkeeping) as changes.
     chain = Column(String, nullable=True)
-    meta = Column(JSON, nullable=True)
+    meta = Column(MutableDict.as_mutable(JSONB), nullable=True)
 
     # Aggregated logs snapshot across tools (JSON stringified by scanner)
     logs = Column(Text, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Findings summary stored by the scanner when the scan finishes, so
+    # reports don't re-aggregate every finding. NULL until then.
+    findings_total = Column(Integer, nullable=True)
+    findings_by_severity = Column(JSONB, nullable=True)
+    findings_by_tool = Column(JSONB, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     started_at = Column(DateTime, nullable=True)
     finished_at = Column(DateTime, nullable=True)
 
@@ -123,14 +132,17 @@ class Finding(Base):
     """
 
     __tablename__ = "findings"
+    # scan_id lookups ordered by created_at (scan detail, findings list);
+    # also serves plain scan_id filters as the leading column.
+    __table_args__ = (Index("ix_findings_scan_created", "scan_id", "created_at"),)
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     scan_id = Column(String, ForeignKey("scans.id", ondelete="CASCADE"), nullable=False)
 
-    tool = Column(String, nullable=False)
+    tool = Column(String, nullable=False, index=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=False)
-    severity = Column(String, nullable=False)  # CRITICAL/HIGH/MEDIUM/LOW/INFO
+    severity = Column(String, nullable=False, index=True)  # CRITICAL/HIGH/MEDIUM/LOW/INFO
 
     category = Column(String, nullable=True)
     file_path = Column(String, nullable=True)
@@ -139,10 +151,10 @@ class Finding(Base):
 
     tool_version = Column(String, nullable=True)
     input_seed = Column(String, nullable=True)
-    coverage = Column(JSON, nullable=True)
-    assertions = Column(JSON, nullable=True)
+    coverage = Column(JSONB, nullable=True)
+    assertions = Column(JSONB, nullable=True)
 
-    raw = Column(JSON, nullable=True)
+    raw = Column(JSONB, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     scan = relationship("Scan", back_populates="findings")
@@ -177,11 +189,11 @@ class ToolExecution(Base):
     duration_seconds = Column(Float, nullable=True)
 
     # Command + environment used for the tool execution
-    command = Column(JSON, nullable=True)  # list[str]
+    command = Column(JSONB, nullable=True)  # list[str]
     exit_code = Column(Integer, nullable=True)
     stdout_path = Column(String, nullable=True)
     stderr_path = Column(String, nullable=True)
-    environment = Column(JSON, nullable=True)
+    environment = Column(JSONB, nullable=True)
     artifacts_path = Column(String, nullable=True)
 
     # Diagnostics and summary
@@ -191,7 +203,11 @@ class ToolExecution(Base):
     findings_count = Column(Integer, nullable=False, default=0)
     tool_version = Column(String, nullable=True)
     input_seed = Column(String, nullable=True)
-    coverage = Column(JSON, nullable=True)
-    assertions = Column(JSON, nullable=True)
+    coverage = Column(JSONB, nullable=True)
+    assertions = Column(JSONB, nullable=True)
+    # Summary counts gathered while parsing the tool's output (e.g. Slither
+    # detectors by severity, Foundry tests passed/failed), so consumers
+    # don't re-parse the stdout log.
+    stats = Column(JSONB, nullable=True)
 
     scan = relationship("Scan", back_populates="tool_executions")
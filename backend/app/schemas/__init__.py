@@ -15,12 +15,14 @@ It is used by:
 
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Generic, List, Optional, TypeVar
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 
 from app.models import ScanStatus, ToolExecutionStatus
 
+T = TypeVar("T")
+
 
 # ---------- Project Schemas ----------
 
@@ -35,8 +37,7 @@ class ProjectRead(ProjectCreate):
     id: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ---------- Scan Schemas ----------
@@ -129,8 +130,7 @@ class ScanRead(BaseModel):
     started_at: Optional[datetime]
     finished_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ---------- Finding Schemas ----------
@@ -154,8 +154,7 @@ class FindingRead(BaseModel):
     raw: Optional[dict]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ---------- Tool Execution Schemas ----------
@@ -184,9 +183,9 @@ class ToolExecutionRead(BaseModel):
     input_seed: Optional[str]
     coverage: Optional[dict]
     assertions: Optional[dict]
+    stats: Optional[dict] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ---------- Aggregated Views ----------
@@ -200,3 +199,22 @@ class ScanDetail(ScanRead):
 class QuickScanResponse(BaseModel):
     project_id: str
     scan_id: str
+
+
+# ---------- Pagination ----------
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of a list endpoint; total is only filled when requested."""
+
+    items: List[T]
+    total: Optional[int] = None
+    limit: int
+    offset: int
+
+
+# Built once at import: list endpoints validate and serialize a whole page
+# in one call instead of one response-model pass per row.
+ProjectPage = TypeAdapter(Page[ProjectRead])
+ScanPage = TypeAdapter(Page[ScanRead])
+FindingPage = TypeAdapter(Page[FindingRead])
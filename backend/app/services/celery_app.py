@@ -34,3 +34,8 @@ celery_app.autodiscover_tasks(["app"])
 celery_app.conf.task_routes = {
     "app.services.tasks.*": {"queue": "scans"},
 }
+
+# Pool processes per worker; app.db.session sizes each one's connection
+# pool from the same setting (one per CPU when unset, as Celery does).
+if settings.celery_worker_concurrency:
+    celery_app.conf.worker_concurrency = settings.celery_worker_concurrency
@@ -27,9 +27,18 @@ Typical failure_reason values:
 - unknown-error
 """
 
+import re
+import threading
 from dataclasses import dataclass
 from typing import Optional
 
+from ahocorasick_rs import BytesAhoCorasick
+
+try:  # optional SIMD literal matcher; Linux/x86-64 only
+    import hyperscan
+except ImportError:  # pragma: no cover - depends on the platform
+    hyperscan = None
+
 from app.services.tools.base import ToolResult
 
 
@@ -41,76 +50,40 @@ class ErrorContext:
     result: ToolResult
 
 
-def _text(value: Optional[str]) -> str:
-    return (value or "").strip()
-
-
-def _lower(value: Optional[str]) -> str:
-    return _text(value).lower()
-
-
-def _contains_any(haystack: str, needles: list[str]) -> bool:
-    return any(n in haystack for n in needles)
-
-
-def classify_tool_failure(tool: str, result: ToolResult) -> str:
-    """Classify a tool failure into a stable failure_reason code.
-
-    This function assumes the tool invocation did *not* succeed.
-    It never returns None; at minimum it returns "unknown-error".
-    """
-    # Shortcuts for readability
-    stdout = _lower(result.output)
-    stderr = _lower(result.error)
-    combined = f"{stdout}\n{stderr}"
-    rc = result.return_code
-    parsing_error = _text(result.parsing_error)
-    existing_reason = _text(result.failure_reason)
-
-    # 1) Respect explicit timeout/crash markers from the runner layer
-    if existing_reason in ("timeout", "process-spawn-error"):
-        return existing_reason
-
-    # 2) Timeouts
-    if "timeout" in stderr or "timed out" in stderr:
-        return "tool-timeout"
-
-    # 3) Parsing / JSON issues
-    if parsing_error:
-        return "tool-output-parse-error"
-
-    # 4) Docker-specific issues
+# Known error signatures (lowercase ASCII), in priority order: when several match,
+# the earliest group wins, exactly as the former if/elif cascade did.
+_SIGNATURES: tuple[tuple[str, tuple[str, ...]], ...] = (
     # Docker daemon unavailable
-    if _contains_any(
-        combined,
-        [
+    (
+        "docker-daemon-unavailable",
+        (
             "cannot connect to the docker daemon",
             "is the docker daemon running",
             "permission denied while trying to connect to the docker daemon",
-        ],
-    ):
-        return "docker-daemon-unavailable"
-
+        ),
+    ),
     # Docker binary not found on PATH
-    if "no such file or directory: 'docker'" in combined or "docker: not found" in combined:
-        return "docker-binary-not-found"
-
+    (
+        "docker-binary-not-found",
+        (
+            "no such file or directory: 'docker'",
+            "docker: not found",
+        ),
+    ),
     # Docker image pull / not found
-    if _contains_any(
-        combined,
-        [
+    (
+        "docker-image-not-found",
+        (
             "pull access denied for",
             "repository does not exist",
             "manifest unknown",
             "no such image",
-        ],
-    ):
-        return "docker-image-not-found"
-
-    # 5) Compilation / build issues (solc / forge / echidna)
-    if _contains_any(
-        combined,
-        [
+        ),
+    ),
+    # Compilation issues (solc / forge / echidna)
+    (
+        "tool-compilation-error",
+        (
             "compilererror",
             "parsererror",
             "typeerror",
@@ -119,58 +92,191 @@ def classify_tool_failure(tool: str, result: ToolResult) -> str:
             "failed to compile",
             "compile error",
             "error while compiling",
-        ],
-    ):
-        return "tool-compilation-error"
-
+        ),
+    ),
     # Foundry/forge-specific build errors
-    if _contains_any(
-        combined,
-        [
+    (
+        "tool-build-error",
+        (
             "forge build failed",
             "failed to build",
             "build failed",
             "error: could not compile",
-        ],
-    ):
-        return "tool-build-error"
-
-    # Echidna not present in image / binary missing
-    if _contains_any(
-        combined,
-        [
+        ),
+    ),
+    # Echidna / Slither / Foundry binary missing from the image
+    (
+        "tool-not-found",
+        (
             "echidna-test: command not found",
             "echidna: command not found",
-        ],
-    ):
-        return "tool-not-found"
-
-    # Slither not present
-    if "slither: command not found" in combined:
-        return "tool-not-found"
-
-    # Foundry/forge binary missing
-    if _contains_any(
-        combined,
-        [
+            "slither: command not found",
             "forge: command not found",
             "foundry: command not found",
-        ],
-    ):
-        return "tool-not-found"
-
-    # 6) Generic runtime/tool errors
-    if _contains_any(
-        combined,
-        [
+        ),
+    ),
+    # Generic runtime/tool errors
+    (
+        "tool-runtime-error",
+        (
             "runtime error",
             "panic:",
             "stack trace:",
             "segmentation fault",
             "segfault",
-        ],
+        ),
+    ),
+)
+
+# Flattened so that a pattern's index is also its priority (lower wins).
+# Encoded once here: the output is matched as bytes.
+# Reasons are shared references to the strings in _SIGNATURES, one per group.
+_PATTERNS = tuple(needle.encode() for _, needles in _SIGNATURES for needle in needles)
+_PATTERN_REASONS = tuple(reason for reason, needles in _SIGNATURES for _ in needles)
+
+# Markers checked ahead of the signature scan.
+_RUNNER_REASONS = frozenset(("timeout", "process-spawn-error"))
+_TIMEOUT_MARKERS = (b"timeout", b"timed out")
+# Caseless (ASCII) search, so stderr needs no lowercased copy for it.
+_TIMEOUT_RE = re.compile(b"|".join(map(re.escape, _TIMEOUT_MARKERS)), re.IGNORECASE)
+
+# One automaton over every signature: the text is scanned once instead of
+# once per needle. Overlapping matches are needed so a lower-priority
+# signature cannot hide a higher-priority one it overlaps with.
+_MATCHER = BytesAhoCorasick(_PATTERNS)
+
+
+def _compile_hyperscan_db():
+    """Compile the signatures into a caseless Hyperscan block-mode database.
+
+    Returns None when Hyperscan is unavailable or fails to compile, in which
+    case the Aho-Corasick matcher is used.
+    """
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=_PATTERNS,
+            ids=range(len(_PATTERNS)),
+            elements=len(_PATTERNS),
+            flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH,
+            literal=True,
+        )
+    except Exception:  # noqa: BLE001
+        return None
+    return db
+
+
+_HS_DB = _compile_hyperscan_db()
+
+# Hyperscan scratch space must not be shared between concurrent scans.
+_HS_LOCAL = threading.local()
+
+
+def _hs_on_match(index: int, start: int, end: int, flags: int, found: list[int]) -> bool:
+    if index < found[0]:
+        found[0] = index
+    # Returning True stops the scan: nothing outranks the first signature.
+    return index == 0
+
+
+def _text(value: Optional[str]) -> str:
+    return (value or "").strip()
+
+
+def _encode(value: Optional[str]) -> bytes:
+    return _text(value).encode("utf-8", "ignore")
+
+
+def _match_signature(*haystacks: bytes) -> Optional[str]:
+    """Return the failure_reason of the highest-priority signature found.
+
+    Each haystack is scanned on its own (no joined copy) and must already be
+    lowercased.
+    """
+    best = len(_PATTERNS)
+    for haystack in haystacks:
+        for index, _, _ in _MATCHER.find_matches_as_indexes(haystack, overlapping=True):
+            if index < best:
+                best = index
+    if best == len(_PATTERNS):
+        return None
+    return _PATTERN_REASONS[best]
+
+
+def _hs_match_signature(*haystacks: bytes) -> Optional[str]:
+    """Hyperscan variant of _match_signature; matching is caseless."""
+    scratch = getattr(_HS_LOCAL, "scratch", None)
+    if scratch is None:
+        scratch = _HS_LOCAL.scratch = hyperscan.Scratch(_HS_DB)
+    found = [len(_PATTERNS)]
+    for haystack in haystacks:
+        try:
+            _HS_DB.scan(
+                haystack,
+                match_event_handler=_hs_on_match,
+                context=found,
+                scratch=scratch,
+            )
+        except hyperscan.ScanTerminated:
+            break  # stopped early by _hs_on_match
+    if found[0] == len(_PATTERNS):
+        return None
+    return _PATTERN_REASONS[found[0]]
+
+
+def classify_tool_failure(tool: str, result: ToolResult) -> str:
+    """Classify a tool failure into a stable failure_reason code.
+
+    This function assumes the tool invocation did *not* succeed.
+    It never returns None; at minimum it returns "unknown-error".
+    """
+    # Shortcuts for readability
+    rc = result.return_code
+    parsing_error = _text(result.parsing_error)
+    existing_reason = _text(result.failure_reason)
+
+    # 1) Respect explicit timeout/crash markers from the runner layer
+    if existing_reason in _RUNNER_REASONS:
+        return existing_reason
+
+    # stdout stays in bytes (as read from the log) all the way to the
+    # matchers; no decode/strip/encode round trip. Only its tail is read,
+    # like the stderr kept in result.error: long fuzzing runs write
+    # megabytes of progress, and the error is at the end.
+    stdout = result.output_tail().strip()
+    stderr = _encode(result.error)
+
+    # Fast path: no output to match and nothing else indicating a failure
+    # always ends in "unknown-error", so skip the scans below.
+    if (
+        not existing_reason
+        and not parsing_error
+        and rc in (None, 0)
+        and not stdout
+        and not stderr
     ):
-        return "tool-runtime-error"
+        return "unknown-error"
+
+    # 2) Timeouts
+    if _TIMEOUT_RE.search(stderr):
+        return "tool-timeout"
+
+    # 3) Parsing / JSON issues
+    if parsing_error:
+        return "tool-output-parse-error"
+
+    # 4-6) Docker, compilation/build, missing binary and runtime signatures.
+    # stdout and stderr are scanned as separate buffers rather than joined.
+    # Hyperscan matches caseless, so it can scan the raw bytes directly;
+    # only the Aho-Corasick fallback needs lowercased copies.
+    if _HS_DB is not None:
+        reason = _hs_match_signature(stdout, stderr)
+    else:
+        reason = _match_signature(stdout.lower(), stderr.lower())
+    if reason is not None:
+        return reason
 
     # 7) Non-zero exit without a more specific classification
     if rc is not None and rc != 0:
@@ -10,15 +10,27 @@ objects (Scan, Finding, ToolExecution) and returns a markdown string.
 It does **not** hit the filesystem or external services.
 """
 
-from collections import Counter, defaultdict
+import json
+from collections import defaultdict
 from datetime import datetime
-from typing import Iterable, List
+from typing import Iterable, Iterator, Sequence
 
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import select
+from sqlalchemy.orm import Session, load_only, selectinload
 
 from app import models
 
 
+# Fixed multi-line fragments, joined once here and emitted as single items.
+_TOOL_TABLE_HEADER = (
+    "| Tool | Status | Exit Code | Findings | Duration (s) | Failure Reason |\n"
+    "|------|--------|-----------|----------|--------------|----------------|"
+)
+_DESCRIPTION_HEADER = "**Description**\n"
+_RAW_OPEN = "<details>\n<summary>Raw tool output</summary>\n\n```json"
+_RAW_CLOSE = "```\n</details>\n"
+
+
 def _format_dt(dt: datetime | None) -> str:
     if not dt:
         return "-"
@@ -26,154 +38,153 @@ def _format_dt(dt: datetime | None) -> str:
     return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
 
 
-def _build_severity_counts(findings: Iterable[models.Finding]) -> dict[str, int]:
-    counter: Counter[str] = Counter()
-    for f in findings:
-        sev = (f.severity or "UNKNOWN").upper()
-        counter[sev] += 1
-    return dict(counter)
-
-
-def _build_tool_counts(findings: Iterable[models.Finding]) -> dict[str, int]:
-    counter: Counter[str] = Counter()
+def _group_findings(
+    findings: Iterable[models.Finding],
+) -> dict[str, dict[str, list[models.Finding]]]:
+    """Group findings by normalized severity, then tool, in a single pass."""
+    grouped: dict[str, dict[str, list[models.Finding]]] = defaultdict(lambda: defaultdict(list))
     for f in findings:
-        tool = (f.tool or "unknown").lower()
-        counter[tool] += 1
-    return dict(counter)
-
-
-def build_scan_markdown(
-    *,
+        grouped[(f.severity or "UNKNOWN").upper()][(f.tool or "unknown").lower()].append(f)
+    return grouped
+
+
+def _counts_from_groups(
+    grouped: dict[str, dict[str, list[models.Finding]]],
+) -> tuple[dict[str, int], dict[str, int]]:
+    """Severity and tool counts derived from group sizes (no second pass)."""
+    severity_counts: dict[str, int] = {}
+    tool_counts: dict[str, int] = {}
+    for sev, by_tool in grouped.items():
+        for tool, tool_findings in by_tool.items():
+            severity_counts[sev] = severity_counts.get(sev, 0) + len(tool_findings)
+            tool_counts[tool] = tool_counts.get(tool, 0) + len(tool_findings)
+    return severity_counts, tool_counts
+
+
+def _render_finding(idx: int, f: models.Finding) -> str:
+    """Render one finding as a single markdown block (several lines)."""
+    location = None
+    if f.file_path:
+        location = f"{f.file_path}:{f.line_number}" if f.line_number else f.file_path
+    fields = (
+        ("Location", location),
+        ("Function", f.function),
+        ("Tool version", f.tool_version),
+        ("Input seed", f.input_seed),
+        ("Coverage", f.coverage),
+        ("Assertions", f.assertions),
+    )
+    parts = [f"##### {idx}. {f.title}", ""]
+    parts.extend(f"- **{label}:** `{value}`" for label, value in fields if value)
+    parts.append("")
+    if f.description:
+        parts += (_DESCRIPTION_HEADER, f"{f.description}", "")
+    if f.raw:
+        # Keep raw JSON compact; truncate extremely long strings is left
+        # to the consumer (UI) if needed.
+        parts += (_RAW_OPEN, json.dumps(f.raw, indent=2, sort_keys=True), _RAW_CLOSE)
+    return "\n".join(parts)
+
+
+def _emit_lines(
     project: models.Project,
     scan: models.Scan,
-    findings: List[models.Finding],
-    tool_executions: List[models.ToolExecution],
-) -> str:
-    """
-    Build a markdown report for a given scan.
-
-    This function assumes all ORM objects are already loaded and attached
-    to an active Session (but does not itself touch the DB).
-    """
-    lines: list[str] = []
-
+    findings: Sequence[models.Finding],
+    tool_executions: Sequence[models.ToolExecution],
+) -> Iterator[str]:
+    """Yield the report one line (or pre-joined block of lines) at a time."""
     # Header
-    lines.append(f"# Security Scan Report")
-    lines.append("")
-    lines.append(f"**Project:** {project.name}")
-    lines.append(f"**Project ID:** `{project.id}`")
-    lines.append(f"**Scan ID:** `{scan.id}`")
+    yield "# Security Scan Report"
+    yield ""
+    yield f"**Project:** {project.name}"
+    yield f"**Project ID:** `{project.id}`"
+    yield f"**Scan ID:** `{scan.id}`"
     if scan.name:
-        lines.append(f"**Scan Name:** {scan.name}")
-    lines.append(f"**Status:** `{scan.status.value}`")
-    lines.append(f"**Target:** `{scan.target}`")
-    lines.append(f"**Tools:** `{', '.join(scan.tools)}`" if scan.tools else "**Tools:** `-`")
+        yield f"**Scan Name:** {scan.name}"
+    yield f"**Status:** `{scan.status.value}`"
+    yield f"**Target:** `{scan.target}`"
+    yield f"**Tools:** `{', '.join(scan.tools)}`" if scan.tools else "**Tools:** `-`"
     if scan.chain:
-        lines.append(f"**Chain / Network:** `{scan.chain}`")
-    lines.append(f"**Created at:** {_format_dt(scan.created_at)}")
-    lines.append(f"**Started at:** {_format_dt(scan.started_at)}")
-    lines.append(f"**Finished at:** {_format_dt(scan.finished_at)}")
-    lines.append("")
+        yield f"**Chain / Network:** `{scan.chain}`"
+    yield f"**Created at:** {_format_dt(scan.created_at)}"
+    yield f"**Started at:** {_format_dt(scan.started_at)}"
+    yield f"**Finished at:** {_format_dt(scan.finished_at)}"
+    yield ""
 
     # Summary tables
-    lines.append("## Summary")
-    lines.append("")
-
-    severity_counts = _build_severity_counts(findings)
-    tool_counts = _build_tool_counts(findings)
-    total_findings = len(findings)
+    yield "## Summary"
+    yield ""
+
+    grouped = _group_findings(findings)
+    if scan.findings_total is not None:
+        # Summary stored by the runner when the scan finished.
+        total_findings = scan.findings_total
+        severity_counts = scan.findings_by_severity or {}
+        tool_counts = scan.findings_by_tool or {}
+    else:
+        total_findings = len(findings)
+        severity_counts, tool_counts = _counts_from_groups(grouped)
 
-    lines.append(f"- **Total findings:** {total_findings}")
+    yield f"- **Total findings:** {total_findings}"
     if severity_counts:
-        lines.append("- **By severity:**")
+        yield "- **By severity:**"
         for sev, count in sorted(severity_counts.items(), key=lambda t: t[0]):
-            lines.append(f"  - {sev}: {count}")
+            yield f"  - {sev}: {count}"
     if tool_counts:
-        lines.append("- **By tool:**")
+        yield "- **By tool:**"
         for tool, count in sorted(tool_counts.items(), key=lambda t: t[0]):
-            lines.append(f"  - {tool}: {count}")
-    lines.append("")
+            yield f"  - {tool}: {count}"
+    yield ""
 
     # Tool execution details
-    lines.append("## Tool Executions")
-    lines.append("")
+    yield "## Tool Executions"
+    yield ""
     if not tool_executions:
-        lines.append("_No tool execution records found for this scan._")
+        yield "_No tool execution records found for this scan._"
     else:
-        lines.append("| Tool | Status | Exit Code | Findings | Duration (s) | Failure Reason |")
-        lines.append("|------|--------|-----------|----------|--------------|----------------|")
+        yield _TOOL_TABLE_HEADER
         for te in sorted(tool_executions, key=lambda t: t.tool):
             status = te.status.value if te.status else "-"
             exit_code = te.exit_code if te.exit_code is not None else "-"
             findings_count = te.findings_count
             duration = f"{te.duration_seconds:.2f}" if te.duration_seconds is not None else "-"
             reason = te.failure_reason or "-"
-            lines.append(
-                f"| {te.tool} | {status} | {exit_code} | {findings_count} | {duration} | {reason} |"
-            )
-    lines.append("")
+            yield f"| {te.tool} | {status} | {exit_code} | {findings_count} | {duration} | {reason} |"
+    yield ""
 
     # Findings by severity & tool
-    lines.append("## Findings")
-    lines.append("")
+    yield "## Findings"
+    yield ""
     if not findings:
-        lines.append("_No findings were recorded for this scan._")
-        return "\n".join(lines)
-
-    # Group findings by severity then tool
-    grouped: dict[str, dict[str, list[models.Finding]]] = defaultdict(lambda: defaultdict(list))
-    for f in findings:
-        sev = (f.severity or "UNKNOWN").upper()
-        tool = (f.tool or "unknown").lower()
-        grouped[sev][tool].append(f)
+        yield "_No findings were recorded for this scan._"
+        return
 
     for severity in sorted(grouped.keys()):
-        lines.append(f"### Severity: {severity}")
-        lines.append("")
+        yield f"### Severity: {severity}"
+        yield ""
         for tool, tool_findings in sorted(grouped[severity].items(), key=lambda t: t[0]):
-            lines.append(f"#### Tool: {tool}")
-            lines.append("")
+            yield f"#### Tool: {tool}"
+            yield ""
             for idx, f in enumerate(sorted(tool_findings, key=lambda x: x.created_at or scan.created_at), start=1):
-                lines.append(f"##### {idx}. {f.title}")
-                lines.append("")
-                if f.file_path:
-                    location = f.file_path
-                    if f.line_number:
-                        location += f":{f.line_number}"
-                    lines.append(f"- **Location:** `{location}`")
-                if f.function:
-                    lines.append(f"- **Function:** `{f.function}`")
-                if f.tool_version:
-                    lines.append(f"- **Tool version:** `{f.tool_version}`")
-                if f.input_seed:
-                    lines.append(f"- **Input seed:** `{f.input_seed}`")
-                if f.coverage:
-                    lines.append(f"- **Coverage:** `{f.coverage}`")
-                if f.assertions:
-                    lines.append(f"- **Assertions:** `{f.assertions}`")
-                lines.append("")
-                if f.description:
-                    lines.append("**Description**")
-                    lines.append("")
-                    lines.append(f"{f.description}")
-                    lines.append("")
-                if f.raw:
-                    lines.append("<details>")
-                    lines.append("<summary>Raw tool output</summary>")
-                    lines.append("")
-                    lines.append("```json")
-                    # Keep raw JSON compact; truncate extremely long strings is left
-                    # to the consumer (UI) if needed.
-                    import json as _json  # local import to avoid global pollution
-
-                    lines.append(_json.dumps(f.raw, indent=2, sort_keys=True))
-                    lines.append("```")
-                    lines.append("</details>")
-                    lines.append("")
-            lines.append("")
-        lines.append("")
-
-    return "\n".join(lines)
+                yield _render_finding(idx, f)
+            yield ""
+        yield ""
+
+
+def build_scan_markdown(
+    *,
+    project: models.Project,
+    scan: models.Scan,
+    findings: Sequence[models.Finding],
+    tool_executions: Sequence[models.ToolExecution],
+) -> str:
+    """
+    Build a markdown report for a given scan.
+
+    This function assumes all ORM objects are already loaded and attached
+    to an active Session (but does not itself touch the DB).
+    """
+    return "\n".join(_emit_lines(project, scan, findings, tool_executions))
 
 
 def build_scan_markdown_from_db(db: Session, scan_id: str) -> str:
@@ -181,16 +192,37 @@ def build_scan_markdown_from_db(db: Session, scan_id: str) -> str:
     Convenience helper that loads a scan + related data from the DB and
     returns the markdown report.
     """
-    scan = (
-        db.query(models.Scan)
+    scan = db.execute(
+        select(models.Scan)
         .options(
             selectinload(models.Scan.project),
-            selectinload(models.Scan.findings),
-            selectinload(models.Scan.tool_executions),
+            # Only the columns the report renders.
+            selectinload(models.Scan.findings).load_only(
+                models.Finding.title,
+                models.Finding.description,
+                models.Finding.severity,
+                models.Finding.tool,
+                models.Finding.file_path,
+                models.Finding.line_number,
+                models.Finding.function,
+                models.Finding.tool_version,
+                models.Finding.input_seed,
+                models.Finding.coverage,
+                models.Finding.assertions,
+                models.Finding.raw,
+                models.Finding.created_at,
+            ),
+            selectinload(models.Scan.tool_executions).load_only(
+                models.ToolExecution.tool,
+                models.ToolExecution.status,
+                models.ToolExecution.exit_code,
+                models.ToolExecution.findings_count,
+                models.ToolExecution.duration_seconds,
+                models.ToolExecution.failure_reason,
+            ),
         )
-        .filter(models.Scan.id == scan_id)
-        .first()
-    )
+        .where(models.Scan.id == scan_id)
+    ).scalar_one_or_none()
     if not scan:
         raise ValueError(f"Scan {scan_id} not found")
 
@@ -198,11 +230,11 @@ def build_scan_markdown_from_db(db: Session, scan_id: str) -> str:
     if not project:
         raise ValueError(f"Scan {scan_id} has no associated project")
 
-    findings = list(scan.findings or [])
-    tool_executions = list(scan.tool_executions or [])
+    # The loaded collections are passed as-is; the builder only iterates
+    # them and takes len().
     return build_scan_markdown(
         project=project,
         scan=scan,
-        findings=findings,
-        tool_executions=tool_executions,
+        findings=scan.findings,
+        tool_executions=scan.tool_executions,
     )
@@ -6,25 +6,58 @@ PDF export for scan reports.
 
 This module builds a PDF from a markdown string in a very simple way:
 it renders the markdown as plain text, preserving headings, bullet
-points, and code blocks as literal lines.
+points, and code blocks as literal lines. Layout is left to ReportLab's
+platypus engine: the markdown is split into text and code-block
+flowables and the document is built in one pass.
 
 For more advanced formatting, a richer markdown→HTML→PDF pipeline can
 be added later, but this keeps dependencies minimal and robust.
 """
 
+import re
 from pathlib import Path
 from typing import Union
 
 from sqlalchemy.orm import Session
 
 from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.platypus import Flowable, Preformatted, SimpleDocTemplate
 
 from app import models
 from app.services.reports.markdown_builder import build_scan_markdown_from_db
 
 PageSize = tuple[float, float]
 
+# ```lang fence lines; re.split on this alternates text and code segments.
+_FENCE_RE = re.compile(r"^```[^\n]*$\n?", re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r"\n[ \t]*\n")
+
+# Lines longer than this are wrapped onto continuation lines.
+_MAX_LINE_LENGTH = 100
+
+
+def _markdown_story(
+    markdown: str,
+    body: ParagraphStyle,
+    code: ParagraphStyle,
+) -> list[Flowable]:
+    """Split markdown into one flowable per text block or fenced code block.
+
+    Text blocks use Preformatted rather than Paragraph: the report is rendered
+    as literal text, and Preformatted skips Paragraph's markup parsing and
+    word-wrapping passes (several times slower on large reports).
+    """
+    story: list[Flowable] = []
+    for i, segment in enumerate(_FENCE_RE.split(markdown)):
+        if i % 2:
+            story.append(Preformatted(segment.rstrip("\n"), code, maxLineLength=_MAX_LINE_LENGTH))
+            continue
+        for block in _BLANK_LINES_RE.split(segment):
+            if block.strip():
+                story.append(Preformatted(block, body, maxLineLength=_MAX_LINE_LENGTH))
+    return story
+
 
 def export_markdown_to_pdf(
     markdown: str,
@@ -46,22 +79,19 @@ def export_markdown_to_pdf(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    c = canvas.Canvas(str(output_path), pagesize=page_size)
-    width, height = page_size
-
-    x = margin_left
-    y = height - margin_top
-
-    for line in markdown.splitlines():
-        if y <= margin_top:
-            c.showPage()
-            y = height - margin_top
-        # Using drawString keeps layout simple and deterministic
-        c.drawString(x, y, line[:2000])  # guard against extremely long lines
-        y -= line_height
-
-    c.showPage()
-    c.save()
+    styles = getSampleStyleSheet()
+    body = ParagraphStyle("ReportBody", parent=styles["BodyText"], leading=line_height)
+    code = ParagraphStyle("ReportCode", parent=styles["Code"], leading=line_height - 4)
+
+    doc = SimpleDocTemplate(
+        str(output_path),
+        pagesize=page_size,
+        leftMargin=margin_left,
+        rightMargin=margin_left,
+        topMargin=margin_top,
+        bottomMargin=margin_top,
+    )
+    doc.build(_markdown_story(markdown, body, code))
     return output_path
 
 
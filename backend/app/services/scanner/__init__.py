@@ -8,13 +8,22 @@ This package provides:
 - Workspace management helpers (workspace.py)
 - Core scan runner orchestration (runner.py)
 - A high-level execute_scan(scan_id) convenience helper
+- execute_scan_tool(...) for running one tool of a fanned-out scan
 
 Concrete tool adapters (Slither, Echidna, Foundry) live under
 app.services.tools and are wired in at runtime by execute_scan.
 """
 
 from .workspace import Workspace, create_workspace  # noqa: F401
-from .runner import ScanContext, ToolRunnerProtocol, run_scan_sync  # noqa: F401
+from .runner import (  # noqa: F401
+    PreparedScan,
+    ScanContext,
+    ToolRunnerProtocol,
+    fail_scan_tool,
+    finalize_scan,
+    prepare_scan,
+    run_scan_concurrent,
+)
 
 
 def execute_scan(scan_id: str) -> None:
@@ -23,7 +32,8 @@ def execute_scan(scan_id: str) -> None:
 
     This helper:
     - constructs the default set of tool runners from app.services.tools
-    - calls run_scan_sync(scan_id, tool_runners)
+    - calls run_scan_concurrent(scan_id, tool_runners), which runs the
+      tools in parallel threads
 
     It is safe to call from:
     - Celery tasks
@@ -32,7 +42,21 @@ def execute_scan(scan_id: str) -> None:
     """
     # Import inside the function to avoid circular imports at module load time.
     from app.services.tools import get_default_tool_runners
-    from app.services.scanner.runner import run_scan_sync as _run_scan_sync
+    from app.services.scanner.runner import run_scan_concurrent as _run_scan_concurrent
 
     tool_runners = get_default_tool_runners()
-    _run_scan_sync(scan_id, tool_runners)
+    _run_scan_concurrent(scan_id, tool_runners)
+
+
+def execute_scan_tool(scan_id: str, tool: str, project_root: str) -> None:
+    """
+    Run a single tool of a scan already set up by prepare_scan.
+
+    Used by the per-tool Celery tasks; tools without a runner are marked
+    as unsupported, exactly as execute_scan does.
+    """
+    from app.services.tools import get_default_tool_runners
+    from app.services.scanner.runner import run_scan_tool_sync
+
+    runner = get_default_tool_runners().get(tool)
+    run_scan_tool_sync(scan_id, tool, runner, project_root)
@@ -17,13 +17,16 @@ Foundry) live under ``app.services.tools`` and implement ToolRunnerProtocol.
 """
 
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-import json
 from pathlib import Path
-from typing import Dict, Protocol
+from typing import Dict, Protocol, Sequence
 
+import orjson
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app import models
 from app.db.session import SessionLocal
@@ -66,9 +69,12 @@ class ToolRunnerProtocol(Protocol):
 
         Implementations are expected to:
         - run the tool (typically via Docker)
-        - update ``execution`` with exit code, paths, findings_count, etc.
+        - update ``execution`` with exit code, paths, status, etc.
         - insert normalized findings into ``models.Finding`` for the scan
 
+        ``execution.findings_count`` need not be set: the runner recounts
+        every execution from the stored findings once all tools have run.
+
         This method must be deterministic and must not implement any
         random retry strategies. Any fuzzing randomness is handled by
         the tools themselves (Echidna/Foundry) via explicit seeds.
@@ -76,24 +82,32 @@ class ToolRunnerProtocol(Protocol):
         ...
 
 
-def _load_scan_context(db: Session, scan_id: str) -> ScanContext:
+def _load_scan_context(
+    db: Session,
+    scan_id: str,
+    project_root: Path | None = None,
+) -> ScanContext:
     """Load Scan + Project and build a Workspace.
 
+    Project sources are materialized into the workspace unless
+    ``project_root`` is given, i.e. they were already materialized by an
+    earlier phase of the same scan.
+
     Raises:
         ValueError: if the scan cannot be found.
     """
-    scan = (
-        db.query(models.Scan)
+    scan = db.execute(
+        select(models.Scan)
         .options(selectinload(models.Scan.project))
-        .filter(models.Scan.id == scan_id)
-        .first()
-    )
+        .where(models.Scan.id == scan_id)
+    ).scalar_one_or_none()
     if not scan:
         raise ValueError(f"Scan {scan_id} not found")
 
     project = scan.project
     workspace = create_workspace(project_id=project.id, scan_id=scan.id)
-    project_root = materialize_project_sources(project.path, workspace)
+    if project_root is None:
+        project_root = materialize_project_sources(project.path, workspace)
     return ScanContext(
         project=project,
         scan=scan,
@@ -106,13 +120,12 @@ def _ensure_tool_executions(db: Session, scan: models.Scan) -> None:
     """Create ToolExecution rows for all tools in scan.tools if missing.
 
     This function is idempotent and can be safely called multiple times
-    for the same scan.
+    for the same scan. New rows are only added to the session; the caller
+    commits them.
     """
-    existing = (
-        db.query(models.ToolExecution)
-        .filter(models.ToolExecution.scan_id == scan.id)
-        .all()
-    )
+    existing = db.execute(
+        select(models.ToolExecution).where(models.ToolExecution.scan_id == scan.id)
+    ).scalars().all()
     existing_by_tool: Dict[str, models.ToolExecution] = {te.tool: te for te in existing}
 
     for tool_name in scan.tools:
@@ -127,18 +140,14 @@ def _ensure_tool_executions(db: Session, scan: models.Scan) -> None:
                 findings_count=0,
             )
         )
-    db.commit()
 
 
-def _build_logs_snapshot(db: Session, scan_id: str) -> str:
-    """Build a compact JSON summary of per-tool execution state."""
-    executions = (
-        db.query(models.ToolExecution)
-        .filter(models.ToolExecution.scan_id == scan_id)
-        .order_by(models.ToolExecution.tool.asc())
-        .all()
-    )
+def _build_logs_snapshot(executions: Sequence[models.ToolExecution]) -> str:
+    """Build a compact JSON summary of per-tool execution state.
 
+    Entries follow the order of ``executions`` (finalize_scan passes them
+    already sorted by tool).
+    """
     snapshot: list[dict] = []
     for exec_ in executions:
         snapshot.append(
@@ -153,133 +162,324 @@ def _build_logs_snapshot(db: Session, scan_id: str) -> str:
                 "stderr_path": exec_.stderr_path,
                 "artifacts_path": exec_.artifacts_path,
                 "findings_count": exec_.findings_count,
-                "started_at": exec_.started_at.isoformat() if exec_.started_at else None,
-                "finished_at": exec_.finished_at.isoformat() if exec_.finished_at else None,
+                "started_at": exec_.started_at,
+                "finished_at": exec_.finished_at,
                 "duration_seconds": exec_.duration_seconds,
             }
         )
-    return json.dumps(snapshot)
+    # Timestamps are naive UTC (datetime.utcnow); orjson formats them itself.
+    return orjson.dumps(snapshot, option=orjson.OPT_NAIVE_UTC).decode()
 
 
-def run_scan_sync(
-    scan_id: str,
-    tool_runners: Dict[str, ToolRunnerProtocol],
+def _update_findings_counts(
+    db: Session,
+    scan: models.Scan,
+    executions: Sequence[models.ToolExecution],
 ) -> None:
-    """Run a scan synchronously in the current process.
+    """Set findings_count on every execution of the scan in one UPDATE.
+
+    Counts come from the findings table (correlated on tool), so tool
+    adapters don't have to maintain the column themselves. The loaded
+    ``executions`` are updated from the UPDATE's RETURNING rows.
+    """
+    counts = (
+        select(func.count())
+        .where(
+            models.Finding.scan_id == scan.id,
+            models.Finding.tool == models.ToolExecution.tool,
+        )
+        .correlate(models.ToolExecution)
+        .scalar_subquery()
+    )
+    rows = db.execute(
+        update(models.ToolExecution)
+        .where(models.ToolExecution.scan_id == scan.id)
+        .values(findings_count=counts)
+        .returning(models.ToolExecution.id, models.ToolExecution.findings_count)
+        .execution_options(synchronize_session=False)
+    ).all()
+    counts_by_id = dict(rows)
+    for exec_ in executions:
+        if exec_.id in counts_by_id:
+            # Already persisted: record the value without marking it dirty.
+            set_committed_value(exec_, "findings_count", counts_by_id[exec_.id])
+
+
+def _store_findings_summary(db: Session, scan: models.Scan) -> None:
+    """Store total and per-severity/per-tool finding counts on the scan.
 
-    Higher-level orchestration (Celery tasks, CLI utilities, etc.)
-    can call this function by providing a mapping from tool name to
-    a concrete ToolRunner implementation.
+    One GROUP BY over the scan's findings. Keys are normalized the way the
+    markdown report groups them (severity upper-cased, tool lower-cased,
+    blanks as UNKNOWN/unknown).
+    """
+    severity = func.upper(func.coalesce(func.nullif(models.Finding.severity, ""), "UNKNOWN"))
+    tool = func.lower(func.coalesce(func.nullif(models.Finding.tool, ""), "unknown"))
+    rows = db.execute(
+        select(severity, tool, func.count())
+        .where(models.Finding.scan_id == scan.id)
+        .group_by(severity, tool)
+    ).all()
+
+    by_severity: Dict[str, int] = {}
+    by_tool: Dict[str, int] = {}
+    for sev, tool_name, count in rows:
+        by_severity[sev] = by_severity.get(sev, 0) + count
+        by_tool[tool_name] = by_tool.get(tool_name, 0) + count
+    scan.findings_total = sum(by_severity.values())
+    scan.findings_by_severity = by_severity
+    scan.findings_by_tool = by_tool
+
+
+def _start_scan(
+    db: Session,
+    scan_id: str,
+) -> tuple[ScanContext, Sequence[models.ToolExecution]] | None:
+    """Load the scan, mark it RUNNING and make sure its executions exist.
+
+    Returns the context and the executions sorted by tool, or None when the
+    scan could not be loaded (it is then already marked FAILED and
+    committed). Nothing else is committed here.
     """
-    db: Session | None = None
     try:
-        db = SessionLocal()
-        try:
-            context = _load_scan_context(db, scan_id)
-        except Exception as exc:  # noqa: BLE001
-            scan = (
-                db.query(models.Scan)
-                .filter(models.Scan.id == scan_id)
-                .first()
-            )
-            if scan:
-                scan.status = models.ScanStatus.FAILED
-                scan.finished_at = datetime.utcnow()
-                scan.logs = json.dumps(
-                    [
-                        {
-                            "tool": "runner",
-                            "status": models.ToolExecutionStatus.FAILED.value,
-                            "error": str(exc),
-                        }
-                    ]
-                )
-                db.commit()
-            return
+        context = _load_scan_context(db, scan_id)
+    except Exception as exc:  # noqa: BLE001
+        scan = db.get(models.Scan, scan_id)
+        if scan:
+            scan.status = models.ScanStatus.FAILED
+            scan.finished_at = datetime.utcnow()
+            scan.logs = orjson.dumps(
+                [
+                    {
+                        "tool": "runner",
+                        "status": models.ToolExecutionStatus.FAILED.value,
+                        "error": str(exc),
+                    }
+                ]
+            ).decode()
+            db.commit()
+        return None
 
-        scan = context.scan
+    scan = context.scan
 
-        # Mark scan as running (only first time)
-        scan.status = models.ScanStatus.RUNNING
-        scan.started_at = scan.started_at or datetime.utcnow()
-        db.commit()
-        db.refresh(scan)
+    # Mark scan as running (only first time)
+    scan.status = models.ScanStatus.RUNNING
+    scan.started_at = scan.started_at or datetime.utcnow()
 
-        # Ensure ToolExecution records exist
-        _ensure_tool_executions(db, scan)
+    # Ensure ToolExecution records exist
+    _ensure_tool_executions(db, scan)
+    db.flush()
 
-        executions = (
-            db.query(models.ToolExecution)
-            .filter(models.ToolExecution.scan_id == scan.id)
-            .order_by(models.ToolExecution.tool.asc())
-            .all()
+    executions = db.execute(
+        select(models.ToolExecution)
+        .where(models.ToolExecution.scan_id == scan.id)
+        .order_by(models.ToolExecution.tool.asc())
+    ).scalars().all()
+    return context, executions
+
+
+def _run_execution(
+    db: Session,
+    context: ScanContext,
+    exec_: models.ToolExecution,
+    runner: ToolRunnerProtocol | None,
+) -> None:
+    """Run one tool and leave ``exec_`` in a terminal state (not committed)."""
+    if runner is None:
+        # Unsupported tool requested; mark as a deterministic failure.
+        exec_.status = models.ToolExecutionStatus.FAILED
+        exec_.failure_reason = "unsupported_tool"
+        exec_.attempt += 1
+        now = datetime.utcnow()
+        exec_.started_at = exec_.started_at or now
+        exec_.finished_at = now
+        exec_.duration_seconds = exec_.duration_seconds or 0.0
+        return
+
+    # Mark as running for this attempt and commit it, so the scan's
+    # progress shows the tool as running while it works. (The scan's
+    # RUNNING state and the executions were committed by prepare_scan.)
+    exec_.status = models.ToolExecutionStatus.RUNNING
+    exec_.attempt += 1
+    if exec_.started_at is None:
+        exec_.started_at = datetime.utcnow()
+    db.commit()
+
+    try:
+        runner.run(db=db, context=context, execution=exec_)
+    except Exception as exc:  # noqa: BLE001
+        # Defensive: convert any uncaught exception into a FAILED state.
+        exec_.status = models.ToolExecutionStatus.FAILED
+        exec_.error = str(exc)
+        exec_.failure_reason = exec_.failure_reason or "runner_exception"
+
+    # Finalize timing; prefer durations set by the tool adapter if any.
+    finished_at = datetime.utcnow()
+    exec_.finished_at = finished_at
+    if exec_.started_at and exec_.duration_seconds is None:
+        exec_.duration_seconds = (finished_at - exec_.started_at).total_seconds()
+
+    # If the tool adapter forgot to set a terminal status, assume success.
+    if exec_.status not in {
+        models.ToolExecutionStatus.SUCCEEDED,
+        models.ToolExecutionStatus.FAILED,
+    }:
+        exec_.status = models.ToolExecutionStatus.SUCCEEDED
+
+
+def _finish_scan(
+    db: Session,
+    scan: models.Scan,
+    executions: Sequence[models.ToolExecution],
+) -> None:
+    """Recount findings, set the scan's final state and commit."""
+    # Flush the executions' final state, then recount their findings;
+    # all of it is committed together with the scan's final state.
+    db.flush()
+    _update_findings_counts(db, scan, executions)
+    # Finalize scan status based on tool results
+    succeeded = any(
+        exec_.status == models.ToolExecutionStatus.SUCCEEDED for exec_ in executions
+    )
+    scan.finished_at = datetime.utcnow()
+    scan.status = models.ScanStatus.SUCCESS if succeeded else models.ScanStatus.FAILED
+    scan.logs = _build_logs_snapshot(executions)
+    _store_findings_summary(db, scan)
+    db.commit()
+
+
+# --- Scan phases -----------------------------------------------------------
+# A scan runs in three phases: prepare_scan, one run_scan_tool_sync per tool
+# and finalize_scan. The phases can run in separate processes (one Celery
+# task per tool) or threads (run_scan_concurrent). Each opens its own session;
+# tools only write their own ToolExecution row and findings, and the scan
+# row is only written by prepare_scan and finalize_scan.
+
+
+@dataclass
+class PreparedScan:
+    """Result of prepare_scan: what the per-tool phase needs."""
+
+    project_root: str
+    tools: list[str]
+
+
+def prepare_scan(scan_id: str) -> PreparedScan | None:
+    """Materialize sources, mark the scan RUNNING and create its executions.
+
+    Returns None when the scan could not be loaded (it is marked FAILED).
+    """
+    with SessionLocal(expire_on_commit=False) as db:
+        started = _start_scan(db, scan_id)
+        if started is None:
+            return None
+        context, executions = started
+        db.commit()
+        return PreparedScan(
+            project_root=str(context.project_root),
+            tools=[exec_.tool for exec_ in executions],
         )
 
-        for exec_ in executions:
-            runner = tool_runners.get(exec_.tool)
-
-            if runner is None:
-                # Unsupported tool requested; mark as a deterministic failure.
-                exec_.status = models.ToolExecutionStatus.FAILED
-                exec_.failure_reason = "unsupported_tool"
-                exec_.attempt += 1
-                now = datetime.utcnow()
-                exec_.started_at = exec_.started_at or now
-                exec_.finished_at = now
-                exec_.duration_seconds = exec_.duration_seconds or 0.0
-                db.commit()
-                db.refresh(exec_)
-                continue
-
-            # Mark as running for this attempt
-            exec_.status = models.ToolExecutionStatus.RUNNING
-            exec_.attempt += 1
-            if exec_.started_at is None:
-                exec_.started_at = datetime.utcnow()
-            db.commit()
-            db.refresh(exec_)
-
-            try:
-                runner.run(db=db, context=context, execution=exec_)
-            except Exception as exc:  # noqa: BLE001
-                # Defensive: convert any uncaught exception into a FAILED state.
-                exec_.status = models.ToolExecutionStatus.FAILED
-                exec_.error = str(exc)
-                exec_.failure_reason = exec_.failure_reason or "runner_exception"
-
-            # Finalize timing; prefer durations set by the tool adapter if any.
-            finished_at = datetime.utcnow()
-            exec_.finished_at = finished_at
-            if exec_.started_at and exec_.duration_seconds is None:
-                exec_.duration_seconds = (finished_at - exec_.started_at).total_seconds()
-
-            # If the tool adapter forgot to set a terminal status, assume success.
-            if exec_.status not in {
-                models.ToolExecutionStatus.SUCCEEDED,
-                models.ToolExecutionStatus.FAILED,
-            }:
-                exec_.status = models.ToolExecutionStatus.SUCCEEDED
 
-            db.commit()
-            db.refresh(exec_)
-
-        # Finalize scan status based on tool results
-        success_count = (
-            db.query(models.ToolExecution)
-            .filter(
-                models.ToolExecution.scan_id == scan.id,
-                models.ToolExecution.status == models.ToolExecutionStatus.SUCCEEDED,
+def run_scan_tool_sync(
+    scan_id: str,
+    tool: str,
+    runner: ToolRunnerProtocol | None,
+    project_root: str,
+) -> None:
+    """Run a single tool of a prepared scan and commit its final state."""
+    with SessionLocal(expire_on_commit=False) as db:
+        context = _load_scan_context(db, scan_id, project_root=Path(project_root))
+        exec_ = db.execute(
+            select(models.ToolExecution).where(
+                models.ToolExecution.scan_id == scan_id,
+                models.ToolExecution.tool == tool,
             )
-            .count()
-        )
-        scan.finished_at = datetime.utcnow()
-        scan.status = (
-            models.ScanStatus.SUCCESS if success_count > 0 else models.ScanStatus.FAILED
+        ).scalar_one()
+        _run_execution(db, context, exec_, runner)
+        db.commit()
+
+
+def fail_scan_tool(scan_id: str, tool: str, error: str) -> None:
+    """Mark a tool's execution FAILED after run_scan_tool_sync itself raised.
+
+    Used when the per-tool phase could not even record its own outcome
+    (e.g. the scan vanished or the database errored), so the execution does
+    not stay PENDING/RUNNING and finalize_scan still sees a terminal state.
+    Executions that already reached a terminal state are left alone.
+    """
+    now = datetime.utcnow()
+    with SessionLocal() as db:
+        db.execute(
+            update(models.ToolExecution)
+            .where(
+                models.ToolExecution.scan_id == scan_id,
+                models.ToolExecution.tool == tool,
+                models.ToolExecution.status.in_(
+                    (models.ToolExecutionStatus.PENDING, models.ToolExecutionStatus.RUNNING)
+                ),
+            )
+            .values(
+                status=models.ToolExecutionStatus.FAILED,
+                error=error,
+                failure_reason="runner_exception",
+                finished_at=now,
+            )
+            .execution_options(synchronize_session=False)
         )
-        scan.logs = _build_logs_snapshot(db, scan.id)
         db.commit()
-        db.refresh(scan)
 
-    finally:
-        if db is not None:
-            db.close()
+
+def finalize_scan(scan_id: str) -> None:
+    """Set the final status, logs and findings summary once all tools ran."""
+    with SessionLocal(expire_on_commit=False) as db:
+        scan = db.get(models.Scan, scan_id)
+        if scan is None:
+            return
+        executions = db.execute(
+            select(models.ToolExecution)
+            .where(models.ToolExecution.scan_id == scan.id)
+            .order_by(models.ToolExecution.tool.asc())
+        ).scalars().all()
+        _finish_scan(db, scan, executions)
+
+
+def run_scan_concurrent(
+    scan_id: str,
+    tool_runners: Dict[str, ToolRunnerProtocol],
+) -> None:
+    """Run a scan in the current process with its tools in parallel.
+
+    The in-process counterpart of the Celery chord: the same three phases,
+    with one thread per tool instead of one task. Tools spend their time
+    waiting on their docker process, so the threads overlap well. A tool
+    thread that raised has its execution marked FAILED; the scan is still
+    finalized and the first such error is re-raised afterwards.
+    """
+    prepared = prepare_scan(scan_id)
+    if prepared is None:
+        return
+    futures = []
+    if prepared.tools:
+        with ThreadPoolExecutor(
+            max_workers=len(prepared.tools),
+            thread_name_prefix="scan-tool",
+        ) as pool:
+            futures = [
+                pool.submit(
+                    run_scan_tool_sync,
+                    scan_id,
+                    tool,
+                    tool_runners.get(tool),
+                    prepared.project_root,
+                )
+                for tool in prepared.tools
+            ]
+    errors = []
+    for tool, future in zip(prepared.tools, futures):
+        exc = future.exception()
+        if exc is not None:
+            fail_scan_tool(scan_id, tool, str(exc))
+            errors.append(exc)
+    finalize_scan(scan_id)
+    if errors:
+        raise errors[0]
@@ -17,12 +17,40 @@ All paths are computed using pathlib, so this works cleanly on
 Windows 11 (for local dev) and inside Linux containers.
 """
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache
+import errno
+import os
 import shutil
+import uuid
 from pathlib import Path
 
 from app.config import get_settings
 
+try:
+    import fcntl
+
+    # Linux FICLONE ioctl (fcntl.FICLONE only exists on Python 3.12+).
+    _FICLONE: int | None = getattr(fcntl, "FICLONE", 0x40049409)
+except ImportError:  # Windows
+    _FICLONE = None
+
+# FICLONE errors meaning "this file pair cannot be cloned here" (filesystem
+# without reflinks, source on another device, ...): fall back to copying.
+# Anything else (ENOSPC, EACCES, EIO, ...) is a real error and propagates.
+_REFLINK_UNSUPPORTED = frozenset(
+    (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EPERM)
+)
+
+# Workspace roots whose layout this process has already created. Scan
+# workspaces are unique per scan and never removed while a scan runs, so
+# membership is enough to skip the filesystem entirely.
+_ENSURED: set[str] = set()
+
+# Deletes directories swapped out by _clear_directory off the scan's path.
+_TRASH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="workspace-trash")
+
 
 @dataclass
 class Workspace:
@@ -38,30 +66,58 @@ class Workspace:
     logs_dir: Path
     artifacts_dir: Path
     tmp_dir: Path
+    _ensured: bool = field(default=False, init=False, repr=False, compare=False)
+    _root_str: str = field(default="", init=False, repr=False, compare=False)
+    _root_prefix: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._root_str = str(self.root)
+        self._root_prefix = self._root_str.rstrip(os.sep) + os.sep
 
     def ensure_created(self) -> None:
         """
         Create all workspace directories if they do not already exist.
-        """
-        self.root.mkdir(parents=True, exist_ok=True)
-        self.contracts_dir.mkdir(parents=True, exist_ok=True)
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
-        self.artifacts_dir.mkdir(parents=True, exist_ok=True)
-        self.tmp_dir.mkdir(parents=True, exist_ok=True)
 
-    def path_relative_to_root(self, path: Path) -> str:
+        Only the root needs ``parents=True``; the subdirectories sit directly
+        under it. tmp_dir is created last, so when it exists the layout is
+        complete and a single stat is enough. Once done, later calls for the
+        same root in this process (on any Workspace object, e.g. per-tool
+        Celery tasks of one scan) are no-ops without touching the filesystem.
+        """
+        if self._ensured:
+            return
+        root = self._root_str
+        if root not in _ENSURED:
+            if not self.tmp_dir.is_dir():
+                self.root.mkdir(parents=True, exist_ok=True)
+                for directory in (self.contracts_dir, self.logs_dir, self.artifacts_dir, self.tmp_dir):
+                    directory.mkdir(exist_ok=True)
+            _ENSURED.add(root)
+        self._ensured = True
+
+    def path_relative_to_root(self, path: str | os.PathLike[str]) -> str:
         """
         Return a POSIX-style relative path from the workspace root.
 
         This is useful for storing paths in the database or logs in a
         portable way, regardless of the underlying OS path separators.
+        Workspace paths are built from ``root``, so a string prefix check
+        is enough (no PurePath parsing); plain strings such as
+        ``ToolResult.stdout_path`` can be passed as they are.
         """
-        try:
-            rel = path.relative_to(self.root)
-        except ValueError:
-            # If the path is not under root, just return its name
-            rel = path.name
-        return rel.as_posix()
+        s = os.fspath(path)
+        if s.startswith(self._root_prefix):
+            return s[len(self._root_prefix):].replace(os.sep, "/")
+        if s == self._root_str:
+            return "."
+        # If the path is not under root, just return its name
+        return os.path.basename(s)
+
+
+@cache
+def _root() -> Path:
+    """Settings.workspace_root as a Path, resolved once per process."""
+    return Path(get_settings().workspace_root)
 
 
 def build_workspace_root(project_id: str, scan_id: str) -> Path:
@@ -72,8 +128,7 @@ def build_workspace_root(project_id: str, scan_id: str) -> Path:
     `/workspaces` inside the backend container, but can be overridden via
     environment variables.
     """
-    settings = get_settings()
-    return Path(settings.workspace_root) / project_id / scan_id
+    return _root() / project_id / scan_id
 
 
 def create_workspace(project_id: str, scan_id: str) -> Workspace:
@@ -98,7 +153,27 @@ def create_workspace(project_id: str, scan_id: str) -> Workspace:
 
 
 def _clear_directory(path: Path) -> None:
-    """Remove all children of ``path`` without deleting the directory itself."""
+    """
+    Leave ``path`` as an empty directory.
+
+    A non-empty directory is renamed aside and replaced by a fresh one (two
+    syscalls however large the previous tree was); the old tree is deleted
+    in a background thread. If the rename fails, children are removed in
+    place.
+    """
+    with os.scandir(path) as entries:
+        if next(entries, None) is None:
+            return
+
+    trash = path.parent / f".trash-{uuid.uuid4().hex}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        pass
+    else:
+        os.mkdir(path)
+        _TRASH_EXECUTOR.submit(shutil.rmtree, trash, ignore_errors=True)
+        return
 
     for child in path.iterdir():
         if child.is_dir() and not child.is_symlink():
@@ -107,15 +182,87 @@ def _clear_directory(path: Path) -> None:
             child.unlink(missing_ok=True)
 
 
+def _reflink(src: str, dst: str) -> bool:
+    """Clone ``src`` to ``dst`` copy-on-write (btrfs/XFS); False if unsupported."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError as exc:
+            if exc.errno not in _REFLINK_UNSUPPORTED:
+                raise
+            cloned = False
+        else:
+            cloned = True
+    if not cloned:
+        os.unlink(dst)
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def _copy_files(pairs: list[tuple[str, str]]) -> None:
+    """Copy (src, dst) pairs in parallel, then apply metadata in one pass.
+
+    shutil.copyfile releases the GIL while the kernel copies, so a small
+    thread pool keeps several files in flight on SSD-backed volumes.
+    """
+    if len(pairs) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as pool:
+            for future in [pool.submit(shutil.copyfile, src, dst) for src, dst in pairs]:
+                future.result()
+    else:
+        for src, dst in pairs:
+            shutil.copyfile(src, dst)
+    for src, dst in pairs:
+        shutil.copystat(src, dst)
+
+
+def _clone_tree(source: Path, destination: Path) -> None:
+    """
+    Mirror ``source`` into the existing ``destination`` directory.
+
+    Each file is reflinked when the filesystem supports it and copied
+    otherwise; copies are collected and done in parallel once the walk is
+    over. The first unsupported reflink disables it for the rest of the
+    tree. Symlinks are followed, as shutil.copytree does by default.
+    Directories are created with a single plain mkdir each: the walk is
+    top-down, so every parent already exists and nothing needs
+    ``parents=True`` or an existence check.
+
+    Files are never hardlinked: the tools get the tree mounted read-write
+    and forge rewrites out/, cache/ and lib/ files in place, which through
+    a shared inode would modify the user's sources.
+    """
+    use_reflink = _FICLONE is not None
+    to_copy: list[tuple[str, str]] = []
+    for dirpath, _dirnames, filenames in os.walk(source, followlinks=True):
+        rel = os.path.relpath(dirpath, source)
+        target_dir = str(destination) if rel == "." else os.path.join(destination, rel)
+        if rel != ".":
+            # Top-down walk: the parent was created on an earlier iteration.
+            os.mkdir(target_dir)
+        for name in filenames:
+            src = os.path.join(dirpath, name)
+            dst = os.path.join(target_dir, name)
+            if use_reflink:
+                if _reflink(src, dst):
+                    continue
+                use_reflink = False
+            to_copy.append((src, dst))
+    if to_copy:
+        _copy_files(to_copy)
+
+
 def materialize_project_sources(project_path: str | Path, workspace: Workspace) -> Path:
     """
-    Copy the user-provided project sources into the workspace.
+    Materialize the user-provided project sources into the workspace.
 
     The dockerized scanners (Slither/Echidna/Foundry) run against paths that
     exist inside the backend container and, by extension, inside the Docker
     daemon. This helper ensures that even when users provide an absolute path
     from their host machine, we work with a workspace-local copy that is
-    guaranteed to be mountable.
+    guaranteed to be mountable. Files are reflinked where the filesystem
+    allows it and copied otherwise (see _clone_tree).
 
     Returns the path to the workspace-local project root (typically
     ``workspace.contracts_dir``) that tool runners should mount.
@@ -123,14 +270,17 @@ def materialize_project_sources(project_path: str | Path, workspace: Workspace)
 
     source = Path(project_path).expanduser()
     workspace.ensure_created()
-    workspace.contracts_dir.mkdir(parents=True, exist_ok=True)
 
+    # Lexical containment check; only a symlinked source needs the
+    # realpath() walk that Path.resolve() performs.
+    src_abs = os.path.realpath(source) if os.path.islink(source) else os.path.abspath(source)
+    root_abs = os.path.abspath(workspace.root)
     try:
-        if source.resolve().is_relative_to(workspace.root.resolve()):
+        if os.path.commonpath((src_abs, root_abs)) == root_abs:
             # Already inside the workspace; nothing to copy.
             return source
     except ValueError:
-        # Path is outside the workspace; proceed with copy below.
+        # Different drives on Windows; proceed with copy below.
         pass
 
     if not source.exists():
@@ -141,7 +291,7 @@ def materialize_project_sources(project_path: str | Path, workspace: Workspace)
     _clear_directory(workspace.contracts_dir)
 
     if source.is_dir():
-        shutil.copytree(source, workspace.contracts_dir, dirs_exist_ok=True)
+        _clone_tree(source, workspace.contracts_dir)
         return workspace.contracts_dir
 
     # Single file: copy into contracts_dir and treat that directory as the root
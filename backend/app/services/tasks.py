@@ -5,25 +5,132 @@ from __future__ import annotations
 Celery tasks for the fuzz backend.
 
 Currently provides:
-- run_scan_task: execute a scan (Slither, Echidna, Foundry) in the background.
+- run_scan_task: prepare a scan and fan its tools out as a chord
+- run_scan_tool_task: run a single tool of a prepared scan
+- finalize_scan_task: chord callback that sets the scan's final state
 """
 
-from celery import Task
+import threading
 
+from celery import Task, chord
+from celery.signals import worker_ready, worker_shutdown
+
+from app import models
+from app.config import get_settings
+from app.db.session import SessionLocal
 from app.services.celery_app import celery_app
-from app.services.scanner import execute_scan
+from app.services.scanner import execute_scan_tool, fail_scan_tool, finalize_scan, prepare_scan
+from app.services.tools import docker_pool, warmup_tool_images
+
+settings = get_settings()
+
+
+def _record_dispatch(scan_id: str, task_id: str | None) -> bool:
+    """Stamp the Celery task id onto scan.meta once the worker picks it up.
+
+    Returns False if the scan is gone or its tools were already dispatched
+    (a redelivered run_scan_task), in which case nothing is written.
+    """
+    with SessionLocal() as db:
+        scan = db.get(models.Scan, scan_id)
+        if scan is None:
+            return False
+        if scan.meta is None:
+            scan.meta = {}
+        if scan.meta.get("chord_id"):
+            return False
+        scan.meta["celery_task_id"] = task_id
+        scan.meta["execution_mode"] = "celery"
+        db.commit()
+        return True
 
 
-@celery_app.task(bind=True, name="app.services.tasks.run_scan_task")
+def _record_chord(scan_id: str, chord_id: str) -> None:
+    """Mark the scan's tools as dispatched (see _record_dispatch)."""
+    with SessionLocal() as db:
+        scan = db.get(models.Scan, scan_id)
+        if scan is None:
+            return
+        if scan.meta is None:
+            scan.meta = {}
+        scan.meta["chord_id"] = chord_id
+        db.commit()
+
+
+# Scan tasks are acknowledged only once they finish, so a task whose worker
+# is stopped or loses its broker connection mid-run is delivered again
+# instead of stranding the scan in RUNNING. A pool process that is killed
+# (e.g. OOM on a huge report) fails its task rather than re-queueing it
+# forever. Redeliveries are safe: run_scan_task returns early once the
+# chord is dispatched, a tool re-run is recorded as another attempt and
+# finalize_scan recomputes.
+_SCAN_TASK_OPTIONS = {"acks_late": True}
+
+
+@celery_app.task(bind=True, name="app.services.tasks.run_scan_task", **_SCAN_TASK_OPTIONS)
 def run_scan_task(self: Task, scan_id: str) -> None:
     """
     Celery task: execute the full scan pipeline for a given scan_id.
 
-    This calls app.services.scanner.execute_scan, which will:
-    - load the scan and project from the database
-    - create a workspace
-    - run Slither, Echidna, Foundry (via Docker) as requested
-    - persist ToolExecution and Finding records
-    - update Scan status and logs
+    The tools are independent, so instead of running them one after the
+    other this task:
+    - loads the scan, materializes the workspace and creates the
+      ToolExecution rows (prepare_scan)
+    - dispatches one run_scan_tool_task per tool as a chord, so the tools
+      run in parallel on the available worker processes
+    - lets finalize_scan_task recount findings and set the Scan status and
+      logs once every tool task has finished; the same task is attached as
+      the chord's error callback, so the scan is finalized even if a tool
+      task fails outright
+
+    The tool tasks may run on any worker process, so every worker must see
+    the same workspace_root (the compose file shares the backend_workspaces
+    volume between api and worker; workers on other hosts need it on
+    shared storage at the same path).
     """
-    execute_scan(scan_id)
+    if not _record_dispatch(scan_id, self.request.id):
+        return
+    prepared = prepare_scan(scan_id)
+    if prepared is None:
+        return
+    if not prepared.tools:
+        finalize_scan(scan_id)
+        return
+    result = chord(
+        run_scan_tool_task.si(scan_id, tool, prepared.project_root)
+        for tool in prepared.tools
+    )(finalize_scan_task.si(scan_id).on_error(finalize_scan_task.si(scan_id)))
+    _record_chord(scan_id, result.id)
+
+
+@celery_app.task(name="app.services.tasks.run_scan_tool_task", **_SCAN_TASK_OPTIONS)
+def run_scan_tool_task(scan_id: str, tool: str, project_root: str) -> None:
+    """Celery task: run one tool of a scan prepared by run_scan_task.
+
+    Errors are recorded on the tool's execution instead of being raised: a
+    failed header task would keep Celery from running the chord body.
+    """
+    try:
+        execute_scan_tool(scan_id, tool, project_root)
+    except Exception as exc:  # noqa: BLE001
+        fail_scan_tool(scan_id, tool, str(exc))
+
+
+@celery_app.task(name="app.services.tasks.finalize_scan_task", **_SCAN_TASK_OPTIONS)
+def finalize_scan_task(scan_id: str) -> None:
+    """Celery task: chord callback that finishes the scan."""
+    finalize_scan(scan_id)
+
+
+@worker_ready.connect
+def _warm_tool_images(**_: object) -> None:
+    """Pre-pull and start the tool images in the background at worker boot."""
+    if not settings.docker_warmup_enabled:
+        return
+    threading.Thread(target=warmup_tool_images, name="tool-warmup", daemon=True).start()
+
+
+@worker_shutdown.connect
+def _stop_docker_pool(**_: object) -> None:
+    """Remove pooled tool containers when the worker stops (no-op if disabled)."""
+    docker_pool.shutdown()
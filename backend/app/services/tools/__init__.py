@@ -14,12 +14,15 @@ that constructs ToolRunner instances for all supported tools:
 The runner in `app.services.scanner.runner` accepts a mapping from tool name
 to an object implementing `ToolRunnerProtocol`. These adapters satisfy that
 protocol and are wired here in one place so Celery tasks or synchronous
-utility scripts can easily obtain the full set.
+utility scripts can easily obtain the full set. `warmup_tool_images`
+prepares all tool images at once (used when a Celery worker boots).
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 
 from app.services.scanner.runner import ToolRunnerProtocol
+from app.services.tools import echidna_tool, foundry_tool, slither_tool
 from app.services.tools.echidna_tool import EchidnaToolRunner
 from app.services.tools.foundry_tool import FoundryToolRunner
 from app.services.tools.slither_tool import SlitherToolRunner
@@ -32,3 +35,11 @@ def get_default_tool_runners() -> Dict[str, ToolRunnerProtocol]:
         FoundryToolRunner(),
     ]
     return {runner.name: runner for runner in runners}
+
+
+def warmup_tool_images() -> None:
+    """Run every adapter's warmup() concurrently and wait for them."""
+    warmups = (slither_tool.warmup, echidna_tool.warmup, foundry_tool.warmup)
+    with ThreadPoolExecutor(max_workers=len(warmups), thread_name_prefix="tool-warmup") as pool:
+        for warmup in warmups:
+            pool.submit(warmup)
@@ -9,6 +9,7 @@ This module provides:
 - ToolSettings: per-tool runtime configuration (timeouts, env, etc.)
 - ToolResult: structured result for a single tool invocation
 - run_command: low-level helper that executes a command and captures logs
+- source_tree_lock: serializes tool runs that build in the same source tree
 - detect_tool_version: small helper for binaries that support --version
 - NormalizedFinding: neutral in-memory finding representation
 - store_normalized_findings: persistence helper for normalized findings
@@ -20,20 +21,27 @@ NOTE: We invoke tools via Docker (`docker run ...`) from the adapters to
 respect the project requirement that **no host-installed tools** are used.
 """
 
+import mmap
 import os
+import re
+import shutil
 import subprocess
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List
 
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 
 from app import models
+from app.db.session import SessionLocal
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolSettings:
     """Per-tool runtime settings."""
 
@@ -43,32 +51,180 @@ class ToolSettings:
     env: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
 class ToolResult:
-    """Result of a single tool invocation."""
-
-    success: bool
-    output: str
-    error: str | None = None
-    return_code: int | None = None
-    command: list[str] | None = None
-    stdout_path: str | None = None
-    stderr_path: str | None = None
-    environment: dict[str, str] | None = None
-    started_at: datetime | None = None
-    finished_at: datetime | None = None
-    duration_seconds: float | None = None
-    parsing_error: str | None = None
-    failure_reason: str | None = None
-    artifacts_path: str | None = None
-    tool_version: str | None = None
+    """Result of a single tool invocation.
+
+    ``output`` and ``error`` are read from ``stdout_path``/``stderr_path`` on
+    first access unless passed explicitly, so callers that only look at the
+    return code or the log paths never load the logs into memory. ``output``
+    is the raw stdout bytes (it is only pattern-matched or fed to orjson,
+    never shown); ``error`` is text, as it is stored on the execution, and
+    holds at most the last ``_LOG_TAIL_BYTES`` of stderr. ``output_tail()``
+    reads the same amount from the end of stdout, for callers that only
+    pattern-match it.
+    """
+
+    __slots__ = (
+        "success",
+        "_output",
+        "_error",
+        "return_code",
+        "command",
+        "stdout_path",
+        "stderr_path",
+        "environment",
+        "started_at",
+        "finished_at",
+        "duration_seconds",
+        "parsing_error",
+        "failure_reason",
+        "artifacts_path",
+        "tool_version",
+    )
+
+    def __init__(
+        self,
+        success: bool,
+        output: bytes | None = None,
+        error: str | None = None,
+        return_code: int | None = None,
+        command: list[str] | None = None,
+        stdout_path: str | None = None,
+        stderr_path: str | None = None,
+        environment: dict[str, str] | None = None,
+        started_at: datetime | None = None,
+        finished_at: datetime | None = None,
+        duration_seconds: float | None = None,
+        parsing_error: str | None = None,
+        failure_reason: str | None = None,
+        artifacts_path: str | None = None,
+        tool_version: str | None = None,
+    ) -> None:
+        self.success = success
+        self._output = output
+        self._error = error
+        self.return_code = return_code
+        self.command = command
+        self.stdout_path = stdout_path
+        self.stderr_path = stderr_path
+        self.environment = environment
+        self.started_at = started_at
+        self.finished_at = finished_at
+        self.duration_seconds = duration_seconds
+        self.parsing_error = parsing_error
+        self.failure_reason = failure_reason
+        self.artifacts_path = artifacts_path
+        self.tool_version = tool_version
+
+    @property
+    def output(self) -> bytes:
+        if self._output is None:
+            self._output = _safe_read_bytes(Path(self.stdout_path)) if self.stdout_path else b""
+        return self._output
+
+    @output.setter
+    def output(self, value: bytes | None) -> None:
+        self._output = value
+
+    def output_tail(self) -> bytes:
+        """The last ``_LOG_TAIL_BYTES`` of stdout, without reading the whole log."""
+        if self._output is not None:
+            return self._output[-_LOG_TAIL_BYTES:]
+        if not self.stdout_path:
+            return b""
+        return _read_tail(self.stdout_path, _LOG_TAIL_BYTES)
+
+    @property
+    def error(self) -> str | None:
+        if self._error is None and self.stderr_path:
+            # The cut may split a multi-byte character.
+            tail = _read_tail(self.stderr_path, _LOG_TAIL_BYTES)
+            self._error = tail.decode(errors="replace")
+        return self._error or None
+
+    @error.setter
+    def error(self, value: str | None) -> None:
+        self._error = value
+
+    def __repr__(self) -> str:
+        return (
+            f"ToolResult(success={self.success!r}, return_code={self.return_code!r}, "
+            f"failure_reason={self.failure_reason!r}, stdout_path={self.stdout_path!r})"
+        )
+
+    @contextmanager
+    def stdout_view(self) -> Iterator[memoryview | bytes]:
+        """Map the stdout log read-only, for parsers that take buffers (orjson).
+
+        The parser reads the page cache directly instead of a copy of the
+        whole log. Yields ``b""`` if the log is missing, empty or only
+        whitespace (nothing to parse); the view is released when the block
+        exits and must not be kept.
+        """
+        if not self.stdout_path:
+            yield b""
+            return
+        try:
+            stdout = open(self.stdout_path, "rb")
+        except OSError:
+            yield b""
+            return
+        with stdout:
+            try:
+                mapped = mmap.mmap(stdout.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped.
+                yield b""
+                return
+            with mapped:
+                if _BLANK.match(mapped):
+                    yield b""
+                    return
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    view.release()
+
+
+# Matches a buffer holding nothing but whitespace; stops at the first
+# other byte, so it is cheap on real output.
+_BLANK = re.compile(rb"\s*\Z")
+
+
+# Bytes of a log kept in ToolResult.error (stderr) and read by
+# ToolResult.output_tail (stdout): tools can write megabytes of progress
+# output, while the cause of a failure is at the end.
+_LOG_TAIL_BYTES = 65536
+
+
+def _read_tail(path: str, limit: int) -> bytes:
+    """Last ``limit`` bytes of the file at ``path`` (b"" if unreadable)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return b""
+    try:
+        size = os.fstat(fd).st_size
+        n = min(size, limit)
+        return os.pread(fd, n, size - n)
+    except OSError:
+        return b""
+    finally:
+        os.close(fd)
 
 
-def _safe_read(path: Path) -> str:
+def _safe_read_bytes(path: Path) -> bytes:
     try:
-        return path.read_text()
+        return path.read_bytes()
     except OSError:
-        return ""
+        return b""
+
+
+@lru_cache(maxsize=32)
+def _resolve_executable(name: str, search_path: str | None) -> str:
+    """Absolute path of ``name`` on ``search_path``, or ``name`` if not found."""
+    return shutil.which(name, path=search_path) or name
 
 
 def run_command(
@@ -84,6 +240,11 @@ def run_command(
 
     This helper is used by all tool adapters. It is intentionally agnostic
     to Docker; the adapters build `cmd` including `docker run ...` if needed.
+
+    The executable is resolved to an absolute path and fds are not closed
+    in the child (Python's own fds are non-inheritable anyway), which lets
+    subprocess launch it with posix_spawn instead of fork+exec as long as
+    no ``workdir`` is given. The child writes straight into the log files.
     """
     log_dir_path = Path(log_dir or Path.cwd() / "logs")
     log_dir_path.mkdir(parents=True, exist_ok=True)
@@ -93,45 +254,42 @@ def run_command(
     environment = os.environ.copy()
     environment.update(env or {})
 
+    # One wall-clock read for the timestamp; the duration comes from the
+    # monotonic counter and finished_at is derived from both.
     started_at = datetime.utcnow()
+    t0 = time.perf_counter_ns()
     try:
-        with stdout_path.open("w", encoding="utf-8", errors="ignore") as stdout, stderr_path.open(
-            "w", encoding="utf-8", errors="ignore"
-        ) as stderr:
+        with stdout_path.open("wb") as stdout, stderr_path.open("wb") as stderr:
             proc = subprocess.run(
-                cmd,
+                [_resolve_executable(cmd[0], environment.get("PATH")), *cmd[1:]],
                 stdout=stdout,
                 stderr=stderr,
-                text=True,
                 timeout=max_runtime or timeout,
                 check=False,
+                close_fds=False,
                 cwd=str(workdir) if workdir is not None else None,
                 env=environment,
             )
-        finished_at = datetime.utcnow()
-        output = _safe_read(stdout_path)
-        error_output = _safe_read(stderr_path)
+        duration_seconds = (time.perf_counter_ns() - t0) / 1e9
+        # output/error are read from the log files only if an adapter asks.
         return ToolResult(
             success=proc.returncode == 0,
-            output=output,
-            error=error_output or None,
             return_code=proc.returncode,
             command=cmd,
             stdout_path=str(stdout_path),
             stderr_path=str(stderr_path),
             environment=environment,
             started_at=started_at,
-            finished_at=finished_at,
-            duration_seconds=(finished_at - started_at).total_seconds(),
+            finished_at=started_at + timedelta(seconds=duration_seconds),
+            duration_seconds=duration_seconds,
             artifacts_path=str(log_dir_path),
             # Detailed failure_reason will be set by error_classifier.
             failure_reason=None,
         )
     except subprocess.TimeoutExpired:
-        finished_at = datetime.utcnow()
+        duration_seconds = (time.perf_counter_ns() - t0) / 1e9
         return ToolResult(
             success=False,
-            output=_safe_read(stdout_path),
             error="timeout",
             return_code=None,
             command=cmd,
@@ -139,16 +297,15 @@ def run_command(
             stderr_path=str(stderr_path),
             environment=environment,
             started_at=started_at,
-            finished_at=finished_at,
-            duration_seconds=(finished_at - started_at).total_seconds(),
+            finished_at=started_at + timedelta(seconds=duration_seconds),
+            duration_seconds=duration_seconds,
             artifacts_path=str(log_dir_path),
             failure_reason="timeout",
         )
     except OSError as exc:
-        finished_at = datetime.utcnow()
+        duration_seconds = (time.perf_counter_ns() - t0) / 1e9
         return ToolResult(
             success=False,
-            output=_safe_read(stdout_path),
             error=str(exc),
             return_code=None,
             command=cmd,
@@ -156,16 +313,42 @@ def run_command(
             stderr_path=str(stderr_path),
             environment=environment,
             started_at=started_at,
-            finished_at=finished_at,
-            duration_seconds=(finished_at - started_at).total_seconds(),
+            finished_at=started_at + timedelta(seconds=duration_seconds),
+            duration_seconds=duration_seconds,
             artifacts_path=str(log_dir_path),
             failure_reason="process-spawn-error",
         )
 
 
-@lru_cache(maxsize=32)
+# Results of detect_tool_version by binary. Plain dict reads/writes are
+# atomic under the GIL; two threads racing on a miss both spawn the binary
+# and store the same answer, which is harmless.
+_VERSION_CACHE: dict[str, str | None] = {}
+
+
+@contextmanager
+def source_tree_lock(path: str | os.PathLike[str]) -> Iterator[None]:
+    """Hold an exclusive lock on the source tree at ``path`` for the block.
+
+    The tools of a scan run in parallel (one Celery task or thread each),
+    but Slither and Echidna both bind-mount the project's host directory
+    and crytic-compile builds into its out/, cache/ and crytic-export/, so
+    two runs on one tree would overwrite each other's build output. The
+    lock is a Postgres transaction-level advisory lock on the path, so it
+    holds across processes and hosts and is released when the block exits
+    or the connection drops. Runs on different trees do not wait.
+    """
+    with SessionLocal() as db:
+        db.execute(select(func.pg_advisory_xact_lock(func.hashtext(os.fspath(path)))))
+        yield
+
+
 def detect_tool_version(binary: str) -> str | None:
     """Best-effort version detection for non-Docker binaries."""
+    try:
+        return _VERSION_CACHE[binary]
+    except KeyError:
+        pass
     try:
         proc = subprocess.run(
             [binary, "--version"],
@@ -175,12 +358,14 @@ def detect_tool_version(binary: str) -> str | None:
             check=False,
         )
         output = (proc.stdout or proc.stderr or "").strip()
-        return output.splitlines()[0] if output else None
+        version = output.splitlines()[0] if output else None
     except OSError:
-        return None
+        version = None
+    _VERSION_CACHE[binary] = version
+    return version
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedFinding:
     """In-memory representation of a tool finding."""
 
@@ -199,32 +384,50 @@ class NormalizedFinding:
     assertions: Dict[str, Any] | None = None
 
 
+# Findings per INSERT when storing a stream of findings.
+_INSERT_BATCH_SIZE = 1000
+
+
+def _finding_row(scan_id: str, f: NormalizedFinding) -> dict[str, Any]:
+    return {
+        "scan_id": scan_id,
+        "tool": f.tool,
+        "title": f.title,
+        "description": f.description,
+        "severity": f.severity,
+        "category": f.category,
+        "file_path": f.file_path,
+        "line_number": f.line_number,
+        "function": f.function,
+        "raw": f.raw,
+        "tool_version": f.tool_version,
+        "input_seed": f.input_seed,
+        "coverage": f.coverage,
+        "assertions": f.assertions,
+    }
+
+
 def store_normalized_findings(
     db: Session,
     scan: models.Scan,
-    findings: list[NormalizedFinding],
+    findings: Iterable[NormalizedFinding],
 ) -> int:
-    """Persist a list of NormalizedFinding into the database."""
+    """Persist NormalizedFindings into the database; returns how many.
+
+    ``findings`` may be a generator: rows go out through ORM bulk INSERTs
+    (executemany with batched VALUES) every _INSERT_BATCH_SIZE findings,
+    so a parser can stream findings without building the full list.
+    """
     count = 0
+    rows: list[dict[str, Any]] = []
     for f in findings:
-        db.add(
-            models.Finding(
-                scan_id=scan.id,
-                tool=f.tool,
-                title=f.title,
-                description=f.description,
-                severity=f.severity,
-                category=f.category,
-                file_path=f.file_path,
-                line_number=f.line_number,
-                function=f.function,
-                raw=f.raw,
-                tool_version=f.tool_version,
-                input_seed=f.input_seed,
-                coverage=f.coverage,
-                assertions=f.assertions,
-            )
-        )
-        count += 1
+        rows.append(_finding_row(scan.id, f))
+        if len(rows) >= _INSERT_BATCH_SIZE:
+            db.execute(insert(models.Finding), rows)
+            count += len(rows)
+            rows = []
+    if rows:
+        db.execute(insert(models.Finding), rows)
+        count += len(rows)
     db.commit()
     return count
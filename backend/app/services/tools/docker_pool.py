@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+"""backend/app/services/tools/docker_pool.py
+
+Optional pool of long-lived tool containers.
+
+By default every tool run is a fresh `docker run --rm IMAGE ...`, which
+pays container creation (namespaces, cgroups, layer setup) each time. With
+`settings.docker_pool_enabled`, tools instead run through `docker exec`
+in one warm container per image:
+
+- each pooled container runs `sleep infinity` and bind-mounts the host
+  directory `docker_pool_host_root` (default: `projects_host_root`) at
+  `/pool`, so any project below that directory is visible without a new
+  mount (Slither, Echidna), and `workspace_root` at its own path, the way
+  the plain `docker run` mounts Foundry's per-scan workspace copy;
+- tool commands run under `timeout`, so a run that times out on our side
+  does not keep running inside the long-lived container;
+- containers are named after their image and the worker that owns them
+  (hostname and pid of the process that imported this module; Celery's
+  prefork children inherit it), so the pool processes of one worker share
+  them while other workers, and their shutdown, leave them alone;
+- a pooled container that has gone away (removed by hand, daemon restart)
+  is started again and the tool run retried once (see run_tool);
+- a project outside the pooled directory, or a container that cannot be
+  started, falls back to the plain `docker run` command.
+
+The adapters call `docker_command`, which returns the argv prefix and the
+project path inside the container for either mode, and run the result with
+`run_tool`. `warm_image` prepares an image ahead of the first run (see the
+adapters' `warmup`).
+"""
+
+import atexit
+import hashlib
+import os
+import re
+import socket
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any
+
+from app.config import get_settings
+from app.services.tools.base import ToolResult, run_command
+
+settings = get_settings()
+
+_DOCKER_BIN: str = getattr(settings, "docker_binary", "docker")
+_POOL_ROOT = "/pool"
+_HOST_ROOT: str | None = settings.docker_pool_host_root or settings.projects_host_root
+_WORKSPACE_ROOT = settings.workspace_root.replace("\\", "/").rstrip("/")
+
+# Seconds allowed for the docker CLI calls that manage pooled containers.
+_MANAGE_TIMEOUT = 60
+# Seconds allowed for pulling an image during warm-up.
+_PULL_TIMEOUT = 1800
+# Extra seconds the in-container `timeout` grants over run_command's own
+# deadline, so a timeout is still reported as one (failure_reason
+# "timeout") before the tool is killed in the container.
+_EXEC_KILL_GRACE = 5
+
+# Owner of the pooled containers started from this process (see the module
+# docstring). Forked children keep the parent's pid here.
+_OWNER_PID = os.getpid()
+_OWNER = re.sub(r"[^A-Za-z0-9_.-]", "-", f"{socket.gethostname()}-{_OWNER_PID}")
+
+# How `docker exec` reports a pooled container that no longer exists or was
+# stopped, as opposed to a failure of the tool itself.
+_DAEMON_ERROR = "Error response from daemon:"
+_STALE_CONTAINER_ERRORS = ("No such container", "is not running")
+
+# image -> name of a running pooled container (per process).
+_containers: dict[str, str] = {}
+_lock = threading.Lock()
+
+
+def _container_name(image: str) -> str:
+    return f"fuzz-pool-{_OWNER}-{hashlib.sha1(image.encode()).hexdigest()[:12]}"
+
+
+def _normalize(path: str) -> str:
+    return path.replace("\\", "/").rstrip("/")
+
+
+def _pool_path(host_root: str) -> str | None:
+    """Path of ``host_root`` inside a pooled container, if it is mounted."""
+    host = _normalize(host_root)
+    if host == _WORKSPACE_ROOT or host.startswith(_WORKSPACE_ROOT + "/"):
+        return host
+    if not _HOST_ROOT:
+        return None
+    base = _normalize(_HOST_ROOT)
+    if host == base:
+        return _POOL_ROOT
+    if host.startswith(base + "/"):
+        return _POOL_ROOT + host[len(base):]
+    return None
+
+
+def _pool_mounts() -> list[str]:
+    mounts = ["-v", f"{_WORKSPACE_ROOT}:{_WORKSPACE_ROOT}"]
+    if _HOST_ROOT:
+        mounts += ["-v", f"{_HOST_ROOT}:{_POOL_ROOT}"]
+    return mounts
+
+
+def _ensure_container(image: str) -> str | None:
+    """Return the name of a running pooled container for ``image``.
+
+    Starts it if needed. Returns None if it cannot be started.
+    """
+    with _lock:
+        name = _containers.get(image)
+        if name is not None:
+            return name
+
+        name = _container_name(image)
+        try:
+            state = subprocess.run(
+                [_DOCKER_BIN, "inspect", "-f", "{{.State.Running}}", name],
+                capture_output=True,
+                text=True,
+                timeout=_MANAGE_TIMEOUT,
+                check=False,
+            )
+            if state.stdout.strip() != "true":
+                started = subprocess.run(
+                    [
+                        _DOCKER_BIN,
+                        "run",
+                        "-d",
+                        "--rm",
+                        "--name",
+                        name,
+                        "--log-driver",
+                        "none",
+                        "--entrypoint",
+                        "sleep",
+                        *_pool_mounts(),
+                        image,
+                        "infinity",
+                    ],
+                    capture_output=True,
+                    text=True,
+                    timeout=_MANAGE_TIMEOUT,
+                    check=False,
+                )
+                # Another worker process may have started it concurrently.
+                if started.returncode != 0 and "already in use" not in started.stderr:
+                    return None
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+        _containers[image] = name
+        return name
+
+
+def docker_command(
+    image: str,
+    host_root: str | Path,
+    container_root: str = "/project",
+) -> tuple[list[str], str]:
+    """
+    Build the command prefix that runs a tool from ``image`` on ``host_root``.
+
+    Returns ``(argv, project_root_in_container)``; the tool's own argv is
+    appended by the caller. ``host_root`` is a HOST path (see the adapters'
+    _resolve_host_project_root) or, for Foundry, the scan's workspace copy.
+    """
+    if settings.docker_pool_enabled:
+        pooled_root = _pool_path(str(host_root))
+        if pooled_root is not None:
+            name = _ensure_container(image)
+            if name is not None:
+                return [_DOCKER_BIN, "exec", "-w", pooled_root, name], pooled_root
+
+    return [
+        _DOCKER_BIN,
+        "run",
+        "--rm",
+        # Output reaches us through the attached stdout/stderr; don't
+        # have the daemon store a second copy in its json-file log.
+        "--log-driver",
+        "none",
+        "-v",
+        f"{host_root}:{container_root}",
+        image,
+    ], container_root
+
+
+def _is_stale_container(result: ToolResult) -> bool:
+    error = result.error or ""
+    return error.startswith(_DAEMON_ERROR) and any(m in error for m in _STALE_CONTAINER_ERRORS)
+
+
+def run_tool(image: str, cmd: list[str], **kwargs: Any) -> ToolResult:
+    """
+    ``run_command`` for a ``cmd`` built on ``docker_command(image, ...)``.
+
+    A command exec'd into a pooled container runs under ``timeout``: killing
+    the local `docker exec` client on a timeout would leave the tool running
+    in the container. If that container has gone away since it was cached,
+    it is dropped from the cache, started again (same name, so ``cmd``
+    stays valid) and the command retried once.
+    """
+    if cmd[1:2] != ["exec"]:
+        return run_command(cmd, **kwargs)
+    deadline = kwargs.get("max_runtime") or kwargs.get("timeout", 600)
+    # The exec prefix is [docker, "exec", "-w", root, name] (docker_command).
+    cmd = [*cmd[:5], "timeout", "-s", "KILL", str(deadline + _EXEC_KILL_GRACE), *cmd[5:]]
+    result = run_command(cmd, **kwargs)
+    if result.success or not _is_stale_container(result):
+        return result
+    with _lock:
+        _containers.pop(image, None)
+    if _ensure_container(image) is None:
+        return result
+    return run_command(cmd, **kwargs)
+
+
+def warm_image(image: str) -> None:
+    """Get ``image`` ready so the first tool run doesn't pay for it.
+
+    Pulls the image if it is not present locally, then either starts its
+    pooled container (pool enabled) or runs one throwaway container so the
+    storage driver has unpacked the layers. Best effort: errors are ignored,
+    the tool run reports them if they persist.
+    """
+    try:
+        present = subprocess.run(
+            [_DOCKER_BIN, "image", "inspect", "--format", "{{.Id}}", image],
+            capture_output=True,
+            timeout=_MANAGE_TIMEOUT,
+            check=False,
+        )
+        if present.returncode != 0:
+            subprocess.run(
+                [_DOCKER_BIN, "pull", "--quiet", image],
+                capture_output=True,
+                timeout=_PULL_TIMEOUT,
+                check=False,
+            )
+        if settings.docker_pool_enabled:
+            _ensure_container(image)
+            return
+        subprocess.run(
+            [_DOCKER_BIN, "run", "--rm", "--log-driver", "none", "--entrypoint", "true", image],
+            capture_output=True,
+            timeout=_MANAGE_TIMEOUT,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        pass
+
+
+def shutdown() -> None:
+    """Stop (and thereby remove) this worker's pooled containers.
+
+    Only the owning process does it: a forked pool child exiting must not
+    stop containers its parent and siblings still use.
+    """
+    if not settings.docker_pool_enabled or os.getpid() != _OWNER_PID:
+        return
+    images = {settings.slither_image, settings.echidna_image, settings.foundry_image}
+    with _lock:
+        _containers.clear()
+        try:
+            subprocess.run(
+                [_DOCKER_BIN, "stop", "-t", "1", *sorted(_container_name(i) for i in images)],
+                capture_output=True,
+                timeout=_MANAGE_TIMEOUT,
+                check=False,
+            )
+        except (OSError, subprocess.SubprocessError):
+            pass
+
+
+# Also covers processes without a Celery shutdown signal (API workers that
+# run inline scans); stopping already-stopped containers is harmless.
+atexit.register(shutdown)
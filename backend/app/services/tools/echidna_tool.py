@@ -13,15 +13,16 @@ Key points in this version:
 - The host path is derived from `project.path` + an optional
   `settings.projects_host_root` base; this avoids trying to mount paths that
   only exist inside the worker container (the root cause of earlier failures).
-- The scan's `target` is mapped to a path inside the Echidna container
-  (under `/project`) in a robust way, so "contracts", "./", "MyToken.sol",
-  "contracts/EchidnaTokenTest.sol" all resolve sensibly.
+- The scan's `target` file is passed to Echidna by name under the container
+  root, so "MyToken.sol" and "contracts/MyToken.sol" both become
+  `/project/MyToken.sol`.
 """
 
-import json
+import re
 from pathlib import Path
 from typing import List
 
+import orjson
 from sqlalchemy.orm import Session
 
 from app import models
@@ -29,16 +30,25 @@ from app.config import get_settings
 from app.services.diagnostics.error_classifier import classify_tool_failure
 from app.services.scanner.runner import ScanContext
 from app.services.scanner.workspace import Workspace
+from app.services.tools import docker_pool
 from app.services.tools.base import (
     NormalizedFinding,
     ToolResult,
     ToolSettings,
-    run_command,
+    source_tree_lock,
     store_normalized_findings,
 )
 
 settings = get_settings()
 
+# Settings read on every run, bound once at import.
+_ECHIDNA_IMAGE: str = settings.echidna_image
+_PROJECTS_HOST_ROOT: str | None = getattr(settings, "projects_host_root", None)
+_TOOL_VERSION = f"docker:{_ECHIDNA_IMAGE}"
+
+# JSON output starts with an object or array after optional whitespace.
+_JSON_START = re.compile(rb"\s*[\[{]")
+
 
 def _resolve_host_project_root(
     *,
@@ -71,7 +81,7 @@ def _resolve_host_project_root(
        which preserves the previous behaviour for non-Docker or local runs.
     """
     raw_path = getattr(project, "path", None)
-    base = getattr(settings, "projects_host_root", None)  # optional; may be None
+    base = _PROJECTS_HOST_ROOT  # optional; may be None
 
     if isinstance(raw_path, str) and raw_path.strip():
         raw_str = raw_path.strip()
@@ -91,45 +101,9 @@ def _resolve_host_project_root(
     return project_root
 
 
-def _resolve_container_target(
-    *,
-    scan_target: str | None,
-    project_root: Path,
-    container_root: str = "/project",
-) -> str:
-    """
-    Map the scan's target (as stored in the DB) to a path inside the Echidna container.
-
-    The Echidna container always sees the project under `container_root`
-    (typically `/project`). This helper makes sure various user inputs map
-    nicely:
-
-    - None, "", ".", "/"     → treat as "project root": `/project`
-      (Echidna will then need config inside that folder.)
-    - "contracts"            → `/project` if project_root.name == "contracts`
-    - "contracts/Test.sol"   → `/project/Test.sol` if project_root.name == "contracts`
-    - "EchidnaTokenTest.sol" → `/project/EchidnaTokenTest.sol`
-    """
-    raw_target = (scan_target or "").strip()
-    if not raw_target or raw_target in (".", "/"):
-        return container_root
-
-    rel = Path(raw_target.lstrip("/"))
-
-    # If the first segment matches the project root folder name (e.g. "contracts"),
-    # strip it to avoid `/project/contracts/...` when `/project` is already that folder.
-    parts = rel.parts
-    if parts and parts[0] == project_root.name:
-        if len(parts) == 1:
-            # Target was exactly "contracts" → treat as project root
-            rel = Path(".")
-        else:
-            rel = Path(*parts[1:])
-
-    if str(rel) in ("", "."):
-        return container_root
-
-    return f"{container_root}/{rel.as_posix()}"
+def warmup() -> None:
+    """Pull and start the Echidna image once, ahead of the first scan."""
+    docker_pool.warm_image(_ECHIDNA_IMAGE)
 
 
 class EchidnaToolRunner:
@@ -145,6 +119,19 @@ class EchidnaToolRunner:
             fuzz_duration_seconds=getattr(settings, "echidna_fuzz_duration_seconds", None),
         )
 
+        # The echidna-test flags are fixed per runner; only the docker
+        # prefix (see docker_pool) and the target vary per run.
+        cmd_flags: tuple[str, ...] = (
+            "--format", "json",
+            "--contract", "EchidnaTokenTest",
+            "--test-mode", "property",
+        )
+        # Optional fuzz duration limit (seconds)
+        if self.config.fuzz_duration_seconds:
+            # Older Echidna versions use --timeout rather than --test-duration
+            cmd_flags += ("--timeout", str(self.config.fuzz_duration_seconds))
+        self._cmd_flags = cmd_flags
+
     def run(
         self,
         *,
@@ -157,12 +144,10 @@ class EchidnaToolRunner:
         workspace: Workspace = context.workspace
         project_root = context.project_root  # logical project directory for this scan
 
+        # run_command creates the directory.
         log_dir = workspace.logs_dir / self.name
-        log_dir.mkdir(parents=True, exist_ok=True)
-
-               # --- 1. Resolve paths -------------------------------------------------
-        container_root = "/project"
 
+        # --- 1. Resolve paths -------------------------------------------------
         # Host path used for `docker run -v HOST_PATH:/project`.
         # This MUST be a host path, not a container path.
         host_project_root = _resolve_host_project_root(
@@ -170,63 +155,43 @@ class EchidnaToolRunner:
             project_root=project_root,
         )
 
-        # Path to pass to `echidna-test` inside the container.
-        container_target = _resolve_container_target(
-            scan_target=context.scan.target,
-            project_root=project_root,
-            container_root=container_root,
-        )
-        container_project_root = Path("/project")
-
+        # `docker run` (or `docker exec` into a pooled container) prefix and
+        # where the project is visible inside the container.
+        docker_cmd, container_root = docker_pool.docker_command(_ECHIDNA_IMAGE, host_project_root)
 
         # Path to pass to `echidna-test` inside the container.
-        container_target = container_project_root / Path(context.scan.target).name
-
+        container_target = Path(container_root) / Path(context.scan.target).name
 
         # --- 2. Build the Docker command -------------------------------------
-        # NOTE: The left side of `-v` *must* be a HOST path, not a container path.
         cmd: List[str] = [
-            getattr(settings, "docker_binary", "docker"),
-            "run",
-            "--rm",
-            "-v",
-            f"{host_project_root}:{container_root}",
-            settings.echidna_image,
+            *docker_cmd,
             "echidna-test",
-            container_target,
-            "--format", "json",
-            "--contract", "EchidnaTokenTest",
-            "--test-mode", "property",
+            str(container_target),
+            *self._cmd_flags,
         ]
 
-
-
-
-        # Optional fuzz duration limit (seconds)
-        if self.config.fuzz_duration_seconds:
-            # Older Echidna versions use --timeout rather than --test-duration
-            cmd.extend(["--timeout", str(self.config.fuzz_duration_seconds)])
-
-
-        result: ToolResult = run_command(
-            cmd,
-            timeout=self.config.timeout_seconds,
-            env=self.config.env,
-            workdir=workspace.root,
-            log_dir=log_dir,
-            max_runtime=self.config.max_runtime_seconds or self.config.fuzz_duration_seconds,
-        )
+        # The other tools of the scan may be running right now; the ones
+        # mounting this same host tree wait (see source_tree_lock).
+        with source_tree_lock(host_project_root):
+            result: ToolResult = docker_pool.run_tool(
+                _ECHIDNA_IMAGE,
+                cmd,
+                timeout=self.config.timeout_seconds,
+                env=self.config.env,
+                log_dir=log_dir,
+                max_runtime=self.config.max_runtime_seconds or self.config.fuzz_duration_seconds,
+            )
 
         # --- 3. Populate execution metadata ----------------------------------
         execution.command = result.command
         execution.exit_code = result.return_code
-        execution.stdout_path = workspace.path_relative_to_root(Path(result.stdout_path))
-        execution.stderr_path = workspace.path_relative_to_root(Path(result.stderr_path))
+        execution.stdout_path = workspace.path_relative_to_root(result.stdout_path)
+        execution.stderr_path = workspace.path_relative_to_root(result.stderr_path)
         execution.environment = result.environment
         execution.error = result.error
         execution.parsing_error = result.parsing_error
-        execution.artifacts_path = workspace.path_relative_to_root(Path(result.artifacts_path))
-        execution.tool_version = result.tool_version or f"docker:{settings.echidna_image}"
+        execution.artifacts_path = workspace.path_relative_to_root(result.artifacts_path)
+        execution.tool_version = result.tool_version or _TOOL_VERSION
 
         if not result.success:
             execution.failure_reason = classify_tool_failure(self.name, result)
@@ -234,34 +199,51 @@ class EchidnaToolRunner:
         # --- 4. Parse Echidna JSON output into NormalizedFinding -------------
         findings: List[NormalizedFinding] = []
 
-        if result.success and result.output:
-            try:
-                data = json.loads(result.output)
-
-                for issue in data.get("errors", []):
-                    findings.append(
-                        NormalizedFinding(
-                            tool="echidna",
-                            title=issue.get("test", "Echidna issue"),
-                            description=issue.get("message", ""),
-                            severity="HIGH",
-                            category="echidna_property_failure",
-                            file_path=issue.get("file"),
-                            line_number=str(issue.get("line")) if issue.get("line") is not None else None,
-                            function=issue.get("property"),
-                            raw=issue,
-                            tool_version=execution.tool_version,
-                            input_seed=issue.get("seed"),
-                            assertions={"property": issue.get("property")},
-                        )
+        # Parse straight from the mmapped log file; orjson takes any buffer
+        # and long fuzzing runs can emit megabytes of JSON.
+        data: object = None
+        parsing_error: str | None = None
+        if result.success:
+            with result.stdout_view() as raw_output:
+                if raw_output and _JSON_START.match(raw_output) is None:
+                    # Banners or compiler errors printed instead of JSON: report
+                    # them without handing megabytes of text to the parser.
+                    parsing_error = "non-JSON output"
+                elif raw_output:
+                    try:
+                        data = orjson.loads(raw_output)
+                    except orjson.JSONDecodeError as exc:
+                        parsing_error = str(exc)
+
+        if data is not None:
+            append = findings.append
+            tool_version = execution.tool_version
+            for issue in data.get("errors", []):
+                append(
+                    NormalizedFinding(
+                        tool="echidna",
+                        title=issue.get("test", "Echidna issue"),
+                        description=issue.get("message", ""),
+                        severity="HIGH",
+                        category="echidna_property_failure",
+                        file_path=issue.get("file"),
+                        line_number=str(issue.get("line")) if issue.get("line") is not None else None,
+                        function=issue.get("property"),
+                        raw=issue,
+                        tool_version=tool_version,
+                        input_seed=issue.get("seed"),
+                        assertions={"property": issue.get("property")},
                     )
-            except json.JSONDecodeError as exc:
-                result.parsing_error = str(exc)
-                execution.parsing_error = str(exc)
-                execution.failure_reason = classify_tool_failure(self.name, result)
+                )
+
+        if parsing_error is not None:
+            result.parsing_error = parsing_error
+            execution.parsing_error = parsing_error
+            execution.failure_reason = classify_tool_failure(self.name, result)
 
         # --- 5. Persist findings & final status ------------------------------
-        execution.findings_count = store_normalized_findings(db, scan, findings)
+        # findings_count is recounted by the scan runner after all tools run.
+        store_normalized_findings(db, scan, findings)
         execution.status = (
             models.ToolExecutionStatus.SUCCEEDED if result.success else models.ToolExecutionStatus.FAILED
         )
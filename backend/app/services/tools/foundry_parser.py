@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+"""backend/app/services/tools/foundry_parser.py
+
+Parsing of Foundry (`forge test --json`) output into NormalizedFinding.
+
+Kept apart from the Foundry adapter and fully annotated so the backend image
+can compile it with mypyc (see backend/Dockerfile): walking large Foundry
+JSON trees is dict-lookup bound, while the adapter itself is not hot. The
+module works the same when it is not compiled.
+"""
+
+from typing import Dict, Iterator, List, Optional
+
+import orjson
+
+from app.services.tools.base import NormalizedFinding
+
+_FAILURE_STATUSES = frozenset(("fail", "failed", "failure", "error", "panic"))
+# Exact spellings (forge prints e.g. "Failure") checked before lower().
+_FAILURE_STATUSES_EXACT = _FAILURE_STATUSES | {s.capitalize() for s in _FAILURE_STATUSES}
+# Statuses counted as passed tests in the run stats.
+_PASS_STATUSES = frozenset(("success", "Success", "pass", "passed", "Pass", "Passed"))
+
+
+def iter_dicts(obj: object) -> Iterator[dict]:
+    """Iterate over all dict-like entries in a JSON tree, depth-first.
+
+    Uses an explicit stack instead of recursion, so deep traces cannot hit
+    the recursion limit. Children are pushed in reverse so entries come out
+    in document order (the same order as a recursive pre-order walk).
+    """
+    stack: List[object] = [obj]
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        current = pop()
+        if isinstance(current, dict):
+            yield current
+            push(reversed(current.values()))
+        elif isinstance(current, list):
+            push(reversed(current))
+
+
+def extract_findings(
+    payload: object,
+    tool_version: Optional[str],
+    stats: Optional[Dict[str, int]] = None,
+) -> List[NormalizedFinding]:
+    """Convert Foundry JSON output into NormalizedFinding instances.
+
+    If ``stats`` is given, its "tests_passed"/"tests_failed" counters are
+    incremented in the same pass.
+    """
+    findings: List[NormalizedFinding] = []
+    append = findings.append
+    for entry in iter_dicts(payload):
+        # Most nodes are gas/trace/label metadata: reject them with the
+        # cheapest possible checks before doing any other work.
+        status = entry.get("status")
+        if not (
+            (
+                type(status) is str
+                and (status in _FAILURE_STATUSES_EXACT or status.lower() in _FAILURE_STATUSES)
+            )
+            or entry.get("success") is False
+        ):
+            if stats is not None and type(status) is str and status in _PASS_STATUSES:
+                stats["tests_passed"] += 1
+            continue
+        if stats is not None:
+            stats["tests_failed"] += 1
+
+        name = entry.get("name") or entry.get("test")
+        description = (
+            entry.get("reason")
+            or entry.get("error_message")
+            or entry.get("stdout")
+            or "Foundry reported a failing test"
+        )
+
+        append(
+            NormalizedFinding(
+                tool="foundry",
+                title=str(name),
+                description=str(description),
+                severity="HIGH",
+                category=str(entry.get("kind") or "test_failure"),
+                file_path=entry.get("file") or entry.get("source") or entry.get("path"),
+                line_number=str(entry.get("line")) if entry.get("line") else None,
+                function=entry.get("contract") or entry.get("test_contract") or entry.get("function"),
+                raw=entry,
+                tool_version=tool_version,
+            )
+        )
+    return findings
+
+
+def parse_foundry_stream(
+    path: Optional[str],
+    tool_version: Optional[str],
+    stats: Optional[Dict[str, int]] = None,
+) -> Iterator[NormalizedFinding]:
+    """Parse Foundry's line-delimited JSON output from the stdout log.
+
+    Lines are read from the file one at a time, so neither the whole log
+    nor the full list of findings has to be held in memory. ``stats`` is
+    filled as the stream is consumed (see extract_findings).
+    """
+    if not path:
+        return
+    try:
+        stdout = open(path, "rb", buffering=1 << 20)
+    except OSError:
+        return
+    with stdout:
+        for line in stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                payload = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # Non-JSON lines are ignored but preserved in stdout logs.
+                continue
+            yield from extract_findings(payload, tool_version, stats)
@@ -5,9 +5,8 @@ from __future__ import annotations
 Adapter for running **Foundry (forge)** via Docker and normalizing its findings.
 """
 
-import json
 from pathlib import Path
-from typing import Iterable, List
+from typing import List
 
 from sqlalchemy.orm import Session
 
@@ -16,81 +15,20 @@ from app.config import get_settings
 from app.services.diagnostics.error_classifier import classify_tool_failure
 from app.services.scanner.runner import ScanContext
 from app.services.scanner.workspace import Workspace
+from app.services.tools import docker_pool
 from app.services.tools.base import (
-    NormalizedFinding,
     ToolResult,
     ToolSettings,
-    run_command,
     store_normalized_findings,
 )
+from app.services.tools.foundry_parser import parse_foundry_stream
 
 settings = get_settings()
 
-_FAILURE_STATUSES = {"fail", "failed", "failure", "error", "panic"}
-
-
-def _iter_dicts(obj: object) -> Iterable[dict]:
-    """Recursive helper to iterate over all dict-like entries in a JSON tree."""
-    if isinstance(obj, dict):
-        yield obj
-        for value in obj.values():
-            yield from _iter_dicts(value)
-    elif isinstance(obj, list):
-        for item in obj:
-            yield from _iter_dicts(item)
-
-
-def _extract_findings(payload: object, tool_version: str | None) -> List[NormalizedFinding]:
-    """Convert Foundry JSON output into NormalizedFinding instances."""
-    findings: List[NormalizedFinding] = []
-    for entry in _iter_dicts(payload):
-        status_raw = entry.get("status")
-        status = str(status_raw).lower() if isinstance(status_raw, str) else ""
-        success = entry.get("success")
-        is_failure = status in _FAILURE_STATUSES or success is False
-
-        if not is_failure:
-            continue
-
-        name = entry.get("name") or entry.get("test")
-        description = (
-            entry.get("reason")
-            or entry.get("error_message")
-            or entry.get("stdout")
-            or "Foundry reported a failing test"
-        )
-
-        findings.append(
-            NormalizedFinding(
-                tool="foundry",
-                title=str(name),
-                description=str(description),
-                severity="HIGH",
-                category=str(entry.get("kind") or "test_failure"),
-                file_path=entry.get("file") or entry.get("source") or entry.get("path"),
-                line_number=str(entry.get("line")) if entry.get("line") else None,
-                function=entry.get("contract") or entry.get("test_contract") or entry.get("function"),
-                raw=entry,
-                tool_version=tool_version,
-            )
-        )
-    return findings
-
 
-def _parse_foundry_output(output: str, tool_version: str | None) -> List[NormalizedFinding]:
-    """Parse Foundry's line-delimited JSON output."""
-    findings: List[NormalizedFinding] = []
-    for line in output.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError:
-            # Non-JSON lines are ignored but preserved in stdout logs.
-            continue
-        findings.extend(_extract_findings(payload, tool_version))
-    return findings
+def warmup() -> None:
+    """Pull and start the Foundry image once, ahead of the first scan."""
+    docker_pool.warm_image(settings.foundry_image)
 
 
 class FoundryToolRunner:
@@ -116,22 +54,21 @@ class FoundryToolRunner:
         workspace: Workspace = context.workspace
         project_root = context.project_root
 
+        # run_command creates the directory.
         log_dir = workspace.logs_dir / self.name
-        log_dir.mkdir(parents=True, exist_ok=True)
 
         target_rel = scan.target
         target_path = Path(target_rel)
 
-        container_root = "/project"
+        # `docker run` (or `docker exec` into a pooled container) prefix and
+        # where the project is visible inside the container. forge builds in
+        # the scan's own workspace copy of the sources, which no other tool
+        # mounts, so unlike Slither/Echidna it needs no source_tree_lock.
+        docker_cmd, container_root = docker_pool.docker_command(settings.foundry_image, project_root)
         container_target = f"{container_root}/{target_rel}"
 
         cmd: List[str] = [
-            getattr(settings, "docker_binary", "docker"),
-            "run",
-            "--rm",
-            "-v",
-            f"{project_root}:{container_root}",
-            settings.foundry_image,
+            *docker_cmd,
             "forge",
             "test",
             "--json",
@@ -142,34 +79,37 @@ class FoundryToolRunner:
         if target_path.suffix:
             cmd.extend(["--match-path", container_target])
 
-        result: ToolResult = run_command(
+        result: ToolResult = docker_pool.run_tool(
+            settings.foundry_image,
             cmd,
             timeout=self.config.timeout_seconds,
             env=self.config.env,
-            workdir=workspace.root,
             log_dir=log_dir,
             max_runtime=self.config.max_runtime_seconds,
         )
 
         execution.command = result.command
         execution.exit_code = result.return_code
-        execution.stdout_path = workspace.path_relative_to_root(Path(result.stdout_path))
-        execution.stderr_path = workspace.path_relative_to_root(Path(result.stderr_path))
+        execution.stdout_path = workspace.path_relative_to_root(result.stdout_path)
+        execution.stderr_path = workspace.path_relative_to_root(result.stderr_path)
         execution.environment = result.environment
         execution.error = result.error
         execution.parsing_error = result.parsing_error
-        execution.artifacts_path = workspace.path_relative_to_root(Path(result.artifacts_path))
+        execution.artifacts_path = workspace.path_relative_to_root(result.artifacts_path)
         execution.tool_version = result.tool_version or f"docker:{settings.foundry_image}"
 
         if not result.success:
             execution.failure_reason = classify_tool_failure(self.name, result)
 
-        findings = _parse_foundry_output(result.output or "", execution.tool_version)
+        # findings_count is recounted by the scan runner after all tools run.
+        stats = {"tests_passed": 0, "tests_failed": 0}
+        stored = store_normalized_findings(
+            db, scan, parse_foundry_stream(result.stdout_path, execution.tool_version, stats)
+        )
+        execution.stats = stats
 
-        if not findings and not result.success and not execution.failure_reason:
+        if not stored and not result.success and not execution.failure_reason:
             execution.failure_reason = "command-failed"
-
-        execution.findings_count = store_normalized_findings(db, scan, findings)
         execution.status = (
             models.ToolExecutionStatus.SUCCEEDED if result.success else models.ToolExecutionStatus.FAILED
         )
@@ -16,10 +16,10 @@ Key points in this version:
   "contracts/MyToken.sol" all resolve sensibly.
 """
 
-import json
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
 
+import orjson
 from sqlalchemy.orm import Session
 
 from app import models
@@ -27,16 +27,28 @@ from app.config import get_settings
 from app.services.diagnostics.error_classifier import classify_tool_failure
 from app.services.scanner.runner import ScanContext
 from app.services.scanner.workspace import Workspace
+from app.services.tools import docker_pool
 from app.services.tools.base import (
     NormalizedFinding,
     ToolResult,
     ToolSettings,
-    run_command,
+    source_tree_lock,
     store_normalized_findings,
 )
 
 settings = get_settings()
 
+# Slither's impact vocabulary mapped to our severities, so the common case is
+# a dict lookup; anything else still goes through str().upper().
+_IMPACT_SEVERITY: dict[str, str] = {
+    "High": "HIGH",
+    "Medium": "MEDIUM",
+    "Low": "LOW",
+    "Informational": "INFORMATIONAL",
+    "Optimization": "OPTIMIZATION",
+    "INFO": "INFO",
+}
+
 
 def _resolve_host_project_root(
     *,
@@ -134,6 +146,109 @@ def _resolve_container_target(
     return f"{container_root}/{rel.as_posix()}"
 
 
+def _parse_slither(
+    data: object,
+    tool_version: str | None,
+) -> tuple[List[NormalizedFinding], Dict[str, Any]]:
+    """Turn a decoded Slither report into findings plus summary stats.
+
+    Both come out of the same pass over the detectors; the stats are
+    stored on the ToolExecution.
+    """
+    findings: List[NormalizedFinding] = []
+
+    # Slither JSON can be either:
+    # - a dict with results.detectors (typical), or
+    # - a top-level list of detector-like issue objects.
+    if isinstance(data, dict):
+        detectors = data.get("results", {}).get("detectors", ())
+    elif isinstance(data, list):
+        detectors = data
+    else:
+        detectors = ()
+
+    # Loop-invariant lookups bound once; Slither reports can hold thousands
+    # of detector results.
+    append = findings.append
+    # Slither repeats a check for every element it touches; store each
+    # (check, file, first line) only once.
+    seen: set[tuple[object, str | None, str | None]] = set()
+    by_severity: Dict[str, int] = {}
+    total = 0
+    for issue in detectors:
+        if not isinstance(issue, dict):
+            continue
+        total += 1
+        get = issue.get
+
+        elements = get("elements") or [{}]
+        if not isinstance(elements, list):
+            elements = [elements]
+
+        primary = elements[0] if elements else {}
+        if not isinstance(primary, dict):
+            primary = {}
+
+        src_map = primary.get("source_mapping") or {}
+        if not isinstance(src_map, dict):
+            src_map = {}
+
+        filename = (
+            src_map.get("filename_relative")
+            or src_map.get("filename_absolute")
+        )
+
+        lines = src_map.get("lines") or []
+        line_number: str | None = None
+        if isinstance(lines, list) and lines:
+            line_number = str(lines[0])
+        elif isinstance(lines, (int, str)):
+            line_number = str(lines)
+
+        check = get("check")
+        key = (check, filename, line_number)
+        try:
+            if key in seen:
+                continue
+            seen.add(key)
+        except TypeError:
+            # Unhashable (malformed) check/filename: keep it.
+            pass
+
+        impact = get("impact", "INFO")
+        severity = (
+            _IMPACT_SEVERITY.get(impact) if type(impact) is str else None
+        ) or str(impact).upper()
+        by_severity[severity] = by_severity.get(severity, 0) + 1
+
+        append(
+            NormalizedFinding(
+                tool="slither",
+                title=get("check", "slither finding"),
+                description=get("description", ""),
+                severity=severity,
+                category=check,
+                file_path=filename,
+                line_number=line_number,
+                function=primary.get("type"),
+                raw=issue,
+                tool_version=tool_version,
+            )
+        )
+
+    stats: Dict[str, Any] = {
+        "detectors": total,
+        "duplicates": total - len(findings),
+        "by_severity": by_severity,
+    }
+    return findings, stats
+
+
+def warmup() -> None:
+    """Pull and start the Slither image once, ahead of the first scan."""
+    docker_pool.warm_image(settings.slither_image)
+
+
 class SlitherToolRunner:
     """ToolRunner implementation for Slither (static analysis)."""
 
@@ -159,18 +274,23 @@ class SlitherToolRunner:
         workspace: Workspace = context.workspace
         project_root = context.project_root  # logical project directory for this scan
 
+        # run_command creates the directory.
         log_dir = workspace.logs_dir / self.name
-        log_dir.mkdir(parents=True, exist_ok=True)
 
         # --- 1. Resolve paths -------------------------------------------------
-        container_root = "/project"
-
         # Host path used for `docker run -v HOST_PATH:/project`.
         host_project_root = _resolve_host_project_root(
             project=project,
             project_root=project_root,
         )
 
+        # `docker run` (or `docker exec` into a pooled container) prefix and
+        # where the project is visible inside the container.
+        # NOTE: The left side of `-v` *must* be a HOST path, not a container path.
+        docker_cmd, container_root = docker_pool.docker_command(
+            settings.slither_image, host_project_root
+        )
+
         # Path the Slither container should analyze (inside the container).
         container_target = _resolve_container_target(
             scan_target=getattr(scan, "target", None),
@@ -179,65 +299,74 @@ class SlitherToolRunner:
         )
 
         # --- 2. Build the Docker command -------------------------------------
-        # NOTE: The left side of `-v` *must* be a HOST path, not a container path.
-        
         # Run slither inside the container, write JSON to a temp file, then cat it.
         # This ensures stdout is pure JSON (if any) so our Option A + parser work.
+        # The temp dir is private to this run, since a pooled container may
+        # run several scans at once.
         shell_cmd = (
+            "d=$(mktemp -d); "
             "slither "
             f"{container_target} "
-            "--json /tmp/slither.json "
-            "> /tmp/slither.log 2>&1; "  # send human logs to a file
+            "--json $d/slither.json "
+            "> $d/slither.log 2>&1; "  # send human logs to a file
             "rc=$?; "
-            "if [ -f /tmp/slither.json ]; then cat /tmp/slither.json; fi; "
+            "if [ -f $d/slither.json ]; then cat $d/slither.json; fi; "
+            "rm -rf $d; "
             "exit $rc"
         )
-        
+
         cmd: List[str] = [
-            getattr(settings, "docker_binary", "docker"),
-            "run",
-            "--rm",
-            "-v",
-            f"{host_project_root}:{container_root}",
-            settings.slither_image,
+            *docker_cmd,
             "sh",
             "-lc",
             shell_cmd,
         ]
 
-        result: ToolResult = run_command(
-            cmd,
-            timeout=self.config.timeout_seconds,
-            env=self.config.env,
-            workdir=workspace.root,
-            log_dir=log_dir,
-            max_runtime=self.config.max_runtime_seconds,
-        )
+        # The other tools of the scan may be running right now; the ones
+        # mounting this same host tree wait (see source_tree_lock).
+        with source_tree_lock(host_project_root):
+            result: ToolResult = docker_pool.run_tool(
+                settings.slither_image,
+                cmd,
+                timeout=self.config.timeout_seconds,
+                env=self.config.env,
+                log_dir=log_dir,
+                max_runtime=self.config.max_runtime_seconds,
+            )
+
+        # Parse stdout once, straight from the mmapped log file (orjson takes
+        # any buffer); both the exit-code check and the findings use the result.
+        has_output = False
+        data: object = None
+        decode_error: orjson.JSONDecodeError | None = None
+        with result.stdout_view() as raw_output:
+            if raw_output:
+                has_output = True
+                try:
+                    data = orjson.loads(raw_output)
+                except orjson.JSONDecodeError as exc:
+                    decode_error = exc
 
         # --- 2b. Option A: non-zero but JSON output => treat as success -------
         # Slither sometimes exits with a non-zero code when it finds issues,
         # but still produces valid JSON. In that case we *do* want to parse
         # and store findings, not treat it as a hard failure.
-        if not result.success and result.output:
-            try:
-                json.loads(result.output)
-            except json.JSONDecodeError:
-                # Real failure: output isn't valid JSON, leave success=False
-                pass
-            else:
-                # Analysis completed and returned JSON; keep non-zero exit_code
-                # for debugging, but mark the run as logically successful.
-                result.success = True
+        # Otherwise (output isn't valid JSON) it is a real failure and
+        # success stays False.
+        if not result.success and has_output and decode_error is None:
+            # Analysis completed and returned JSON; keep non-zero exit_code
+            # for debugging, but mark the run as logically successful.
+            result.success = True
 
         # --- 3. Populate execution metadata ----------------------------------
         execution.command = result.command
         execution.exit_code = result.return_code
-        execution.stdout_path = workspace.path_relative_to_root(Path(result.stdout_path))
-        execution.stderr_path = workspace.path_relative_to_root(Path(result.stderr_path))
+        execution.stdout_path = workspace.path_relative_to_root(result.stdout_path)
+        execution.stderr_path = workspace.path_relative_to_root(result.stderr_path)
         execution.environment = result.environment
         execution.error = result.error
         execution.parsing_error = result.parsing_error
-        execution.artifacts_path = workspace.path_relative_to_root(Path(result.artifacts_path))
+        execution.artifacts_path = workspace.path_relative_to_root(result.artifacts_path)
         execution.tool_version = result.tool_version or f"docker:{settings.slither_image}"
 
         # Classify failure if tool did not succeed
@@ -246,69 +375,17 @@ class SlitherToolRunner:
 
         # --- 4. Parse Slither JSON output into NormalizedFinding -------------
         findings: List[NormalizedFinding] = []
+        execution.stats = None
 
-        if result.success and result.output:
-            try:
-                data = json.loads(result.output)
-            except json.JSONDecodeError as exc:
+        if result.success and has_output:
+            if decode_error is not None:
                 # JSON is completely broken – record parsing_error but don't crash the runner.
-                result.parsing_error = str(exc)
-                execution.parsing_error = str(exc)
+                result.parsing_error = str(decode_error)
+                execution.parsing_error = str(decode_error)
                 execution.failure_reason = classify_tool_failure(self.name, result)
             else:
                 try:
-                    # Slither JSON can be either:
-                    # - a dict with results.detectors (typical), or
-                    # - a top-level list of detector-like issue objects.
-                    if isinstance(data, dict):
-                        detectors = data.get("results", {}).get("detectors", [])
-                    elif isinstance(data, list):
-                        detectors = data
-                    else:
-                        detectors = []
-
-                    for issue in detectors:
-                        if not isinstance(issue, dict):
-                            continue
-
-                        elements = issue.get("elements") or [{}]
-                        if not isinstance(elements, list):
-                            elements = [elements]
-
-                        primary = elements[0] if elements else {}
-                        if not isinstance(primary, dict):
-                            primary = {}
-
-                        src_map = primary.get("source_mapping") or {}
-                        if not isinstance(src_map, dict):
-                            src_map = {}
-
-                        filename = (
-                            src_map.get("filename_relative")
-                            or src_map.get("filename_absolute")
-                        )
-
-                        lines = src_map.get("lines") or []
-                        line_number: str | None = None
-                        if isinstance(lines, list) and lines:
-                            line_number = str(lines[0])
-                        elif isinstance(lines, (int, str)):
-                            line_number = str(lines)
-
-                        findings.append(
-                            NormalizedFinding(
-                                tool="slither",
-                                title=issue.get("check", "slither finding"),
-                                description=issue.get("description", ""),
-                                severity=str(issue.get("impact", "INFO")).upper(),
-                                category=issue.get("check"),
-                                file_path=filename,
-                                line_number=line_number,
-                                function=primary.get("type"),
-                                raw=issue,
-                                tool_version=execution.tool_version,
-                            )
-                        )
+                    findings, execution.stats = _parse_slither(data, execution.tool_version)
                 except Exception as exc:
                     # Any unexpected structure issue should NOT crash the whole tool run.
                     result.parsing_error = str(exc)
@@ -318,7 +395,8 @@ class SlitherToolRunner:
                     # will still be available for debugging.
 
         # --- 5. Persist findings & final status ------------------------------
-        execution.findings_count = store_normalized_findings(db, scan, findings)
+        # findings_count is recounted by the scan runner after all tools run.
+        store_normalized_findings(db, scan, findings)
         execution.status = (
             models.ToolExecutionStatus.SUCCEEDED if result.success else models.ToolExecutionStatus.FAILED
         )
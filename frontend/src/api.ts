@@ -1,5 +1,6 @@
 import axios from 'axios'
 import type {
+  Page,
   Project,
   ProjectCreate,
   ScanSummary,
@@ -22,9 +23,24 @@ const client = axios.create({
   timeout: 15000
 })
 
+// Largest page the list endpoints accept.
+const PAGE_LIMIT = 500
+
+// The list endpoints are paginated; fetch every page so the views keep
+// showing all rows, not just the newest page.
+async function listAll<T>(path: string): Promise<T[]> {
+  const items: T[] = []
+  for (let offset = 0; ; offset += PAGE_LIMIT) {
+    const res = await client.get<Page<T>>(path, {
+      params: { limit: PAGE_LIMIT, offset }
+    })
+    items.push(...res.data.items)
+    if (res.data.items.length < PAGE_LIMIT) return items
+  }
+}
+
 export async function listProjects(): Promise<Project[]> {
-  const res = await client.get<Project[]>('/projects')
-  return res.data
+  return listAll<Project>('/projects')
 }
 
 export async function createProject(payload: ProjectCreate): Promise<Project> {
@@ -33,8 +49,7 @@ export async function createProject(payload: ProjectCreate): Promise<Project> {
 }
 
 export async function listScans(): Promise<ScanSummary[]> {
-  const res = await client.get<ScanSummary[]>('/scans')
-  return res.data
+  return listAll<ScanSummary>('/scans')
 }
 
 export async function getScan(scanId: string): Promise<ScanDetail> {
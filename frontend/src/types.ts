@@ -74,6 +74,13 @@ export type ScanDetail = ScanSummary & {
   tool_executions: ToolExecution[]
 }
 
+export type Page<T> = {
+  items: T[]
+  total?: number | null
+  limit: number
+  offset: number
+}
+
 export type ToolInfo = {
   name: string
   kind: string